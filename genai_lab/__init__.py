@@ -0,0 +1,6 @@
+"""Generative AI lab experiments, one module per experiment.
+
+Run them with ``python -m genai_lab <experiment> [options]``; importing the package itself is
+cheap, and each experiment module pulls in TensorFlow, transformers or Gradio only when it is
+imported.
+"""
@@ -0,0 +1,78 @@
+"""python -m genai_lab [--profile-dir DIR] <command> [options]; `python -m genai_lab <command> --help` lists a command's options."""
+
+import os
+import sys
+import time
+import argparse
+import importlib
+import subprocess
+
+# command: (module, description). Modules are imported only when their command runs.
+COMMANDS = {
+    "autoencoder": ("autoencoder", "1) train a convolutional autoencoder on MNIST"),
+    "regularization": ("regularization", "2) compare autoencoder regularization techniques"),
+    "vae": ("vae", "3) train a VAE and generate variations of an image"),
+    "fvsbn": ("fvsbn", "4) fully visible sigmoid belief network on binarized MNIST"),
+    "nade": ("nade", "5) NADE on binarized MNIST"),
+    "made": ("made", "6) MADE on binarized MNIST"),
+    "gan": ("gan", "7) vanilla GAN on MNIST"),
+    "progan": ("progan", "8) progressive GAN on MNIST"),
+    "pix2pix": ("pix2pix", "9) pix2pix image-to-image translation on facades"),
+    "lm": ("lm", "10) transformer language model with a BPE tokenizer"),
+    "gpt2": ("gpt2", "11) fine-tune GPT-2 for sentiment classification"),
+    "chat": ("chat", "12) question-answering chat app over OpenRouter"),
+    "search": ("search", "successive-halving search over the regularization study's autoencoders"),
+    "bench": ("bench", "offline train-step and sampler benchmarks"),
+}
+
+def import_times(commands=COMMANDS, repeat=3):
+    """Best-of-`repeat` wall time (seconds) to import each command's module in a fresh interpreter."""
+    times = {}
+    for name in commands:
+        module = f"{__package__ or 'genai_lab'}.{COMMANDS[name][0]}"
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            proc = subprocess.run([sys.executable, "-c", f"import {module}"], capture_output=True, text=True)
+            elapsed = time.perf_counter() - start
+            if proc.returncode:
+                times[name] = proc.stderr.strip().splitlines()[-1]
+                break
+            best = elapsed if best is None else min(best, elapsed)
+        else:
+            times[name] = best
+    return times
+
+def main(argv=None):
+    epilog = "\n".join(f"  {name:16s}{desc}" for name, (_, desc) in COMMANDS.items())
+    epilog += "\n  import-times    time importing each command's module in a fresh interpreter"
+    parser = argparse.ArgumentParser(prog="genai_lab", description=__doc__, epilog="commands:\n" + epilog,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profile-dir", help="write a tf.profiler trace of each training loop under DIR")
+    parser.add_argument("--profile-start", type=int, default=10, help="first profiled step")
+    parser.add_argument("--profile-steps", type=int, default=20, help="number of profiled steps")
+    parser.add_argument("command", choices=[*COMMANDS, "import-times"], metavar="command")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="options for the command")
+    args = parser.parse_args(argv)
+
+    if args.command == "import-times":
+        unknown = set(args.args) - set(COMMANDS)
+        if unknown:
+            parser.error(f"unknown command(s): {', '.join(sorted(unknown))}")
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        print(f"{'interpreter startup':20s} {1e3 * (time.perf_counter() - start):8.0f} ms")
+        for name, t in import_times(args.args or COMMANDS).items():
+            print(f"{name:20s} {1e3 * t:8.0f} ms" if isinstance(t, float) else f"{name:20s} failed: {t}")
+        return 0
+
+    if args.profile_dir:
+        # Read by TrainingTelemetry; environment variables reach every loop and search's worker processes,
+        # and setting them here keeps TensorFlow out of commands that do not train.
+        os.environ.update({"GENAI_LAB_PROFILE_DIR": args.profile_dir, "GENAI_LAB_PROFILE_START": str(args.profile_start),
+                           "GENAI_LAB_PROFILE_STEPS": str(args.profile_steps)})
+    module = importlib.import_module(f".{COMMANDS[args.command][0]}", __package__ or "genai_lab")
+    return module.main(args.args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""1) Implement a basic autoencoder and train it on a dataset like MNIST for image reconstruction."""
+
+import argparse
+
+import numpy as np
+from tensorflow.keras import layers, models
+from tensorflow.keras.datasets import mnist
+import matplotlib.pyplot as plt
+
+from .telemetry import TrainingTelemetry
+
+def load_data():
+    # Load and preprocess MNIST
+    (x_train, _), (x_test, _) = mnist.load_data()
+    x_train = x_train[..., np.newaxis] / 255.0
+    x_test = x_test[..., np.newaxis] / 255.0
+    return x_train, x_test
+
+def build_autoencoder():
+    # Autoencoder architecture
+    inp = layers.Input((28,28,1))
+    x = layers.Conv2D(32,3,activation='relu',padding='same')(inp)
+    x = layers.MaxPooling2D(2,padding='same')(x)
+    x = layers.Conv2D(16,3,activation='relu',padding='same')(x)
+    x = layers.MaxPooling2D(2,padding='same')(x)
+    x = layers.Conv2D(16,3,activation='relu',padding='same')(x)
+    x = layers.UpSampling2D(2)(x)
+    x = layers.Conv2D(32,3,activation='relu',padding='same')(x)
+    x = layers.UpSampling2D(2)(x)
+    out = layers.Conv2D(1,3,activation='sigmoid',padding='same')(x)
+
+    autoencoder = models.Model(inp, out)
+    autoencoder.compile(optimizer='adam', loss='binary_crossentropy')
+    return autoencoder
+
+def show_reconstructions(autoencoder, x_test, n=10):
+    decoded = autoencoder.predict(x_test[:n])
+    plt.figure(figsize=(20,4))
+    for i in range(n):
+        ax = plt.subplot(2, n, i+1)
+        plt.imshow(x_test[i].squeeze(), cmap='gray')
+        ax.set_title('Original')
+        ax.axis('off')
+        ax = plt.subplot(2, n, i+1+n)
+        plt.imshow(decoded[i].squeeze(), cmap='gray')
+        ax.set_title('Reconstructed')
+        ax.axis('off')
+    plt.show()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab autoencoder", description=__doc__)
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--batch-size", type=int, default=128)
+    args = parser.parse_args(argv)
+
+    x_train, x_test = load_data()
+    autoencoder = build_autoencoder()
+
+    # Train
+    telemetry = TrainingTelemetry("autoencoder")
+    autoencoder.fit(x_train, x_train, epochs=args.epochs, batch_size=args.batch_size, validation_data=(x_test, x_test),
+                    verbose=1, callbacks=[telemetry.callback(args.batch_size)])
+    telemetry.report()
+
+    # Visualize
+    show_reconstructions(autoencoder, x_test)
@@ -0,0 +1,257 @@
+"""Offline benchmarks for the train step and sampler of every model in genai_lab.
+
+Each benchmark builds its model from the experiment module and feeds it synthetic MNIST- and
+facade-shaped tensors, so nothing is downloaded and no dataset is touched.
+
+    python -m genai_lab bench run [--only vae,gan] [--steps 20] [--out bench_results/run.json]
+    python -m genai_lab bench compare bench_results/before.json bench_results/after.json
+"""
+
+import os
+import json
+import time
+import argparse
+import platform
+import tempfile
+import functools
+import subprocess
+
+import numpy as np
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def timeit(fn, steps, warmup):
+    """Per-call wall times in seconds after `warmup` untimed calls (tracing, allocation)."""
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(steps):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return times
+
+def _materialize(out):
+    """Block until `out` is computed, so asynchronous device work is timed."""
+    import tensorflow as tf
+    for t in tf.nest.flatten(out):
+        if hasattr(t, "numpy"):
+            t.numpy()
+    return out
+
+# --------------------------- Benchmarks ---------------------------
+# Each returns {case: (callable, examples per call)}.
+
+def bench_autoencoder(batch_size=128):
+    import tensorflow as tf
+    from .regularization import build_autoencoder
+    model = build_autoencoder(None, 0.0, 0.0)
+    model.compile(optimizer="adam", loss="binary_crossentropy")
+    x = tf.random.uniform((batch_size, 28, 28, 1))
+    return {"train_step": (lambda: model.train_on_batch(x, x), batch_size),
+            "reconstruct": (lambda: _materialize(model(x, training=False)), batch_size)}
+
+def bench_vae(batch_size=128, latent_dim=2):
+    import tensorflow as tf
+    from .vae import VAE, build_encoder, build_decoder
+    encoder, decoder = build_encoder(latent_dim), build_decoder(latent_dim)
+    vae = VAE(encoder, decoder)
+    vae.compile(optimizer="adam")
+    x = tf.random.uniform((batch_size, 28, 28, 1))
+    z = tf.random.normal((batch_size, latent_dim))
+    train_step = tf.function(vae.train_step)  # takes bare images, unlike train_on_batch's (x, y, w)
+    return {"train_step": (lambda: _materialize(train_step(x)), batch_size),
+            "sample": (lambda: _materialize(decoder(z, training=False)), batch_size)}
+
+def _likelihood_train_step(model, batch_size):
+    import tensorflow as tf
+    optimizer = tf.keras.optimizers.Adam(1e-3)
+    x = tf.cast(tf.random.uniform((batch_size, 28 * 28)) > 0.5, tf.float32)
+
+    def step():
+        with tf.GradientTape() as tape:
+            loss = model.compute_loss(x)
+        grads = tape.gradient(loss, model.trainable_variables)
+        optimizer.apply_gradients(zip(grads, model.trainable_variables))
+        return loss.numpy()
+    return step
+
+def bench_fvsbn(batch_size=128, num_samples=4):
+    from .fvsbn import FVSBN
+    model = FVSBN(dim=28 * 28)
+    return {"train_step": (_likelihood_train_step(model, batch_size), batch_size),
+            "sample": (lambda: _materialize(model.sample(num_samples)), num_samples)}
+
+def bench_nade(batch_size=256, num_samples=16):
+    from .nade import NADE, model_sample
+    model = NADE(D=28 * 28, H=256)
+    return {"train_step": (_likelihood_train_step(model, batch_size), batch_size),
+            "sample": (lambda: model_sample(model, num_samples), num_samples)}
+
+def bench_made(batch_size=128, num_samples=8):
+    from .made import MADE
+    model = MADE(D=28 * 28, H=400, seed=2)
+    return {"train_step": (_likelihood_train_step(model, batch_size), batch_size),
+            "sample": (lambda: model.sample(num_samples), num_samples)}
+
+def bench_gan(batch_size=256):
+    import tensorflow as tf
+    from . import gan
+    generator, discriminator = gan.build_generator(), gan.build_discriminator()
+    g_opt = tf.keras.optimizers.Adam(gan.LR, beta_1=gan.BETA_1)
+    d_opt = tf.keras.optimizers.Adam(gan.LR, beta_1=gan.BETA_1)
+    train_step = gan.make_train_step(generator, discriminator, g_opt, d_opt)
+    x = tf.random.uniform((batch_size, 28, 28, 1), -1.0, 1.0)
+    noise = tf.random.normal((batch_size, gan.NOISE_DIM))
+    return {"train_step": (lambda: _materialize(train_step(x)), batch_size),
+            "sample": (lambda: _materialize(generator(noise, training=False)), batch_size)}
+
+def bench_progan(batch_size=64):
+    import tensorflow as tf
+    from . import progan
+    cases = {}
+    for r in progan.STAGES:
+        G, D = progan.G(r), progan.D(r)
+        g_opt, d_opt = tf.keras.optimizers.Adam(2e-4, 0.5), tf.keras.optimizers.Adam(2e-4, 0.5)
+        x = tf.random.uniform((batch_size, r, r, 1), -1.0, 1.0)
+        z = tf.random.normal((batch_size, progan.LATENT))
+        cases[f"train_step_{r}"] = (functools.partial(progan.train_step, G, D, x, g_opt, d_opt), batch_size)
+        cases[f"sample_{r}"] = (functools.partial(lambda G, z: _materialize(G(z, training=False)), G, z), batch_size)
+    return cases
+
+def bench_pix2pix(batch_size=4):
+    import tensorflow as tf
+    from . import pix2pix
+    gen, disc = pix2pix.G(), pix2pix.D()
+    step = pix2pix.make_step(gen, disc, tf.keras.optimizers.Adam(2e-4, 0.5), tf.keras.optimizers.Adam(2e-4, 0.5))
+    x = tf.random.uniform((batch_size, pix2pix.IMG, pix2pix.IMG, 3))
+    y = tf.random.uniform((batch_size, pix2pix.IMG, pix2pix.IMG, 3))
+    return {"train_step": (lambda: _materialize(step(x, y)), batch_size),
+            "translate": (lambda: _materialize(gen(x, training=False)), batch_size)}
+
+def bench_transformer_lm(batch_size=16, seq_len=64, vocab_size=500, prompts=4, new_tokens=16):
+    import tensorflow as tf
+    from .lm import train_bpe_tokenizer, build_transformer_lm, generate_batch
+    rng = np.random.default_rng(0)
+    words = [f"w{i}" for i in range(2000)]
+    with tempfile.TemporaryDirectory(prefix="bench_lm_") as tmp:
+        corpus = os.path.join(tmp, "corpus.txt")
+        with open(corpus, "w") as f:
+            f.writelines(" ".join(rng.choice(words, 12)) + "\n" for _ in range(2000))
+        tokenizer = train_bpe_tokenizer(corpus, vocab_size=vocab_size)
+    vocab = tokenizer.get_vocab_size()
+    model = build_transformer_lm(vocab, seq_len)
+    model.compile(optimizer="adam", loss="sparse_categorical_crossentropy")
+    ids = tf.random.uniform((batch_size, seq_len + 1), 0, vocab, dtype=tf.int32)
+    texts = [" ".join(rng.choice(words, 4)) for _ in range(prompts)]
+    return {"train_step": (lambda: model.train_on_batch(ids[:, :-1], ids[:, 1:]), batch_size),
+            "generate": (lambda: generate_batch(model, tokenizer, texts, max_new_tokens=new_tokens), prompts)}
+
+def bench_gpt2_classifier(batch_size=8, seq_len=64):
+    import tensorflow as tf
+    from transformers import GPT2Config, TFGPT2ForSequenceClassification
+    from .gpt2 import make_train_step, make_eval_step
+    config = GPT2Config(vocab_size=1000, n_positions=128, n_embd=64, n_layer=2, n_head=2,
+                        num_labels=2, pad_token_id=0)
+    model = TFGPT2ForSequenceClassification(config)
+    features = {"input_ids": tf.random.uniform((batch_size, seq_len), 1, 1000, dtype=tf.int32),
+                "attention_mask": tf.ones((batch_size, seq_len), tf.int32)}
+    labels = tf.random.uniform((batch_size,), 0, 2, dtype=tf.int32)
+    model(features)
+    fit_step = make_train_step(model, model.trainable_variables, tf.keras.optimizers.Adam(1e-4))
+    eval_step = make_eval_step(model)
+    return {"train_step": (lambda: _materialize(fit_step(features, labels)), batch_size),
+            "classify": (lambda: _materialize(eval_step(features, labels)), batch_size)}
+
+BENCHMARKS = {
+    "autoencoder": bench_autoencoder,
+    "vae": bench_vae,
+    "fvsbn": bench_fvsbn,
+    "nade": bench_nade,
+    "made": bench_made,
+    "gan": bench_gan,
+    "progan": bench_progan,
+    "pix2pix": bench_pix2pix,
+    "transformer_lm": bench_transformer_lm,
+    "gpt2_classifier": bench_gpt2_classifier,
+}
+
+# Autoregressive samplers run one pass per pixel, so they get fewer repetitions.
+SLOW_CASES = {"fvsbn.sample", "nade.sample", "made.sample"}
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=REPO, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(names, steps=20, warmup=3, seed=0):
+    import tensorflow as tf
+    tf.keras.utils.set_random_seed(seed)
+    results = {}
+    for name in names:
+        for case, (fn, examples) in BENCHMARKS[name]().items():
+            key = f"{name}.{case}"
+            n = max(1, steps // 10) if key in SLOW_CASES else steps
+            times = np.array(timeit(fn, n, min(warmup, n)))
+            results[key] = {"median_ms": 1e3 * float(np.median(times)),
+                            "p90_ms": 1e3 * float(np.percentile(times, 90)),
+                            "mean_ms": 1e3 * float(times.mean()),
+                            "steps": n,
+                            "examples_per_s": examples / float(np.median(times))}
+            print(f"{key:32s} {results[key]['median_ms']:10.2f} ms  {results[key]['examples_per_s']:10.1f} ex/s")
+    return {"meta": {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": _git_commit(),
+                     "python": platform.python_version(), "tensorflow": tf.__version__,
+                     "platform": platform.platform(),
+                     "gpu": bool(tf.config.list_physical_devices("GPU"))},
+            "results": results}
+
+def compare(before, after, threshold=0.1):
+    """Print per-case median changes; return the cases that slowed down by more than `threshold`."""
+    regressions = []
+    for key in sorted(set(before["results"]) | set(after["results"])):
+        old, new = before["results"].get(key), after["results"].get(key)
+        if old is None or new is None:
+            print(f"{key:32s} {'only in ' + ('after' if old is None else 'before'):>30s}")
+            continue
+        change = new["median_ms"] / old["median_ms"] - 1
+        flag = "REGRESSION" if change > threshold else "faster" if change < -threshold else ""
+        if flag == "REGRESSION":
+            regressions.append(key)
+        print(f"{key:32s} {old['median_ms']:10.2f} -> {new['median_ms']:10.2f} ms {100 * change:+7.1f}%  {flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab bench", description=__doc__.split("\n\n")[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_p = sub.add_parser("run", help="run benchmarks and write JSON results")
+    run_p.add_argument("--only", help="comma-separated subset of: " + ", ".join(BENCHMARKS))
+    run_p.add_argument("--steps", type=int, default=20)
+    run_p.add_argument("--warmup", type=int, default=3)
+    run_p.add_argument("--out", default=os.path.join("bench_results", time.strftime("%Y%m%d-%H%M%S") + ".json"))
+    cmp_p = sub.add_parser("compare", help="compare two result files and flag regressions")
+    cmp_p.add_argument("before")
+    cmp_p.add_argument("after")
+    cmp_p.add_argument("--threshold", type=float, default=0.1, help="relative slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        names = args.only.split(",") if args.only else list(BENCHMARKS)
+        unknown = set(names) - set(BENCHMARKS)
+        if unknown:
+            parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+        report = run(names, args.steps, args.warmup)
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"wrote {args.out}")
+        return 0
+
+    with open(args.before) as f:
+        before = json.load(f)
+    with open(args.after) as f:
+        after = json.load(f)
+    regressions = compare(before, after, args.threshold)
+    print(f"{len(regressions)} regression(s) above {100 * args.threshold:.0f}%")
+    return 1 if regressions else 0
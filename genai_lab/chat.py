@@ -0,0 +1,689 @@
+"""12) Utilize the OpenAI API to build a question-answering application powered by GPT-3, allowing users to input questions and receive relevant answers.
+
+1.   Go to OpenRouter and Login your account
+2.   Go to Settings and Create API key under API keys section
+3.   Export the key as OPENROUTER_API_KEY, or on Colab make a secret key under the name
+     "OPENROUTER-API-KEY" with the copied key as its value and enable Notebook Access.
+"""
+
+import os
+import re
+import json
+import time
+import random
+import glob
+import zlib
+import asyncio
+import argparse
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+def openrouter_api_key():
+    """The API key from OPENROUTER_API_KEY, else from the Colab secret described above."""
+    key = os.environ.get("OPENROUTER_API_KEY")
+    if key:
+        return key
+    try:
+        from google.colab import userdata
+    except ImportError:
+        raise RuntimeError("Set OPENROUTER_API_KEY to your OpenRouter API key") from None
+    return userdata.get("OPENROUTER-API-KEY")
+
+class ChatError(RuntimeError):
+    """Upstream error while streaming a completion."""
+
+class ChatClient:
+    """Chat-completions client over one pooled keep-alive session, with timeouts and retries.
+
+    429 and 5xx responses and connection errors (including connect timeouts) are retried with
+    exponential backoff and full jitter; a Retry-After header, when present, sets the minimum
+    wait, and a Retry-After longer than `max_retry_after` returns the response instead of
+    waiting for it. A read timeout is not retried: the server may already be generating (and
+    billing) the completion. Every call appends {"status", "attempts", "latency"} to
+    `self.metrics`, which keeps the last `max_metrics` calls (streamed calls add "ttft" and
+    "stream_s"). Point `base_url` at a local stub server to exercise it offline.
+    """
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, api_key, base_url="https://openrouter.ai/api/v1", model="openai/gpt-oss-20b:free",
+                 connect_timeout=5.0, read_timeout=60.0, max_retries=4, backoff_base=0.5, backoff_max=30.0,
+                 max_retry_after=120.0, pool_size=10, max_metrics=1000):
+        self.base_url, self.model = base_url.rstrip("/"), model
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries, self.backoff_base, self.backoff_max = max_retries, backoff_base, backoff_max
+        self.max_retry_after = max_retry_after
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"})
+        self.metrics = deque(maxlen=max_metrics)
+
+    def _retry_delay(self, attempt, response=None):
+        """Seconds to wait before the next attempt, or None if Retry-After asks for too long."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                wait = float(retry_after)
+            except ValueError:
+                try:
+                    wait = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError, AttributeError):  # unparseable: keep the backoff
+                    return delay
+            if wait > self.max_retry_after:
+                return None
+            delay = max(delay, wait)
+        return delay
+
+    def post(self, path, payload, **kwargs):
+        """POST `payload` as JSON with retries; returns the last response (which may be an error)."""
+        start = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.post(f"{self.base_url}{path}", data=json.dumps(payload),
+                                             timeout=self.timeout, **kwargs)
+            except requests.RequestException as e:
+                if not isinstance(e, requests.ConnectionError) or attempt == self.max_retries:
+                    self.metrics.append({"status": None, "attempts": attempt + 1, "latency": time.perf_counter() - start})
+                    raise
+                time.sleep(self._retry_delay(attempt))
+                continue
+            if response.status_code not in self.RETRY_STATUSES or attempt == self.max_retries:
+                break
+            delay = self._retry_delay(attempt, response)
+            if delay is None:
+                break
+            response.close()
+            time.sleep(delay)
+        response.metrics = {"status": response.status_code, "attempts": attempt + 1,
+                            "latency": time.perf_counter() - start}
+        self.metrics.append(response.metrics)
+        return response
+
+    def complete(self, messages, **params):
+        """Return (reply, response) for a chat-completions request.
+
+        Raises ChatError for a 200 response whose body is an error or has no choices.
+        """
+        response = self.post("/chat/completions", {"model": self.model, "messages": messages, **params})
+        if response.status_code != 200:
+            return f"Error {response.status_code}: {response.content}", response
+        try:
+            body = response.json()
+        except ValueError as e:
+            raise ChatError(f"Error: invalid JSON in response: {response.text[:200]!r}") from e
+        if "error" in body:
+            error = body["error"]
+            raise ChatError(f"Error: {error.get('message', error) if isinstance(error, dict) else error}")
+        if not body.get("choices"):
+            raise ChatError(f"Error: response has no choices: {response.text[:200]!r}")
+        return body["choices"][0]["message"]["content"], response
+
+    def stream(self, messages, **params):
+        """Yield reply text deltas as the server streams them (server-sent events).
+
+        Raises ChatError when the request cannot be sent, for a non-200 response, an error event
+        mid-stream, or a stream that ends (or is cut off mid-event) before its [DONE] marker.
+        """
+        start = time.perf_counter()
+        try:
+            response = self.post("/chat/completions", {"model": self.model, "messages": messages, "stream": True,
+                                                       **params}, stream=True)
+        except requests.RequestException as e:
+            raise ChatError(f"Error: could not reach {self.base_url}: {e}") from e
+        with response:
+            if response.status_code != 200:
+                raise ChatError(f"Error {response.status_code}: {response.content}")
+            # SSE is UTF-8 by definition; requests would decode a charset-less text/event-stream
+            # as ISO-8859-1, so split raw bytes into lines and decode each complete line.
+            lines = response.iter_lines(chunk_size=None)
+            done = False
+            while True:
+                try:
+                    raw = next(lines)
+                except StopIteration:
+                    break
+                except requests.RequestException as e:
+                    raise ChatError(f"Stream interrupted: {e}") from e
+                line = raw.decode("utf-8", errors="replace")
+                # Skip blank separators and ": keep-alive" comments.
+                if not line or not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    done = True
+                    break
+                try:
+                    chunk = json.loads(data)
+                except json.JSONDecodeError as e:
+                    raise ChatError(f"Stream cut off mid-event: {data[:80]!r}") from e
+                if "error" in chunk:
+                    raise ChatError(f"Error: {chunk['error'].get('message', chunk['error'])}")
+                delta = chunk["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    response.metrics.setdefault("ttft", time.perf_counter() - start)
+                    yield delta
+            if not done:
+                raise ChatError("Stream ended before the reply was complete")
+        response.metrics["stream_s"] = time.perf_counter() - start
+
+    def latency_summary(self):
+        def percentiles(values):
+            values = sorted(values)
+            return values[len(values) // 2], values[min(len(values) - 1, int(len(values) * 0.95))]
+        if not self.metrics:
+            return {"requests": 0}
+        latencies = [m["latency"] for m in self.metrics]
+        summary = {"requests": len(latencies),
+                   "errors": sum(m["status"] != 200 for m in self.metrics),
+                   "retries": sum(m["attempts"] - 1 for m in self.metrics),
+                   "mean_s": sum(latencies) / len(latencies)}
+        summary["p50_s"], summary["p95_s"] = percentiles(latencies)
+        ttfts = [m["ttft"] for m in self.metrics if "ttft" in m]
+        if ttfts:
+            summary["ttft_p50_s"], summary["ttft_p95_s"] = percentiles(ttfts)
+        return summary
+
+class CompletionCache:
+    """Two-tier cache of chat replies keyed on a canonical hash of the model and messages.
+
+    An in-memory LRU of `max_memory_entries` sits in front of a SQLite table trimmed to
+    `max_disk_entries` by least-recent use; entries older than `ttl` seconds are misses.
+    With normalize=True, message text is compared case-, whitespace- and
+    trailing-punctuation-insensitively, so near-identical FAQ questions share an entry.
+    """
+    def __init__(self, path="chat_cache.sqlite", max_memory_entries=256, max_disk_entries=10000,
+                 ttl=24 * 3600, normalize=False):
+        self.max_memory_entries, self.max_disk_entries = max_memory_entries, max_disk_entries
+        self.ttl, self.normalize = ttl, normalize
+        self._memory = OrderedDict()
+        self._touched = {}  # memory hits since the last put, written to last_used before the disk is trimmed
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS completions (key TEXT PRIMARY KEY, reply TEXT, "
+                         "created REAL, last_used REAL, latency REAL)")
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "saved_s": 0.0}
+
+    def key(self, model, messages):
+        def text(content):
+            return re.sub(r"\s+", " ", content).strip().lower().rstrip("?!. ") if self.normalize else content
+        canonical = json.dumps([model, [[m["role"], text(m["content"])] for m in messages]],
+                               ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, model, messages):
+        start, key = time.perf_counter(), self.key(model, messages)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and time.time() - entry[1] < self.ttl:
+                self._memory.move_to_end(key)
+                self._touched[key] = time.time()
+                self.stats["memory_hits"] += 1
+            else:
+                row = self._db.execute("SELECT reply, created, latency FROM completions WHERE key = ? AND created > ?",
+                                       (key, time.time() - self.ttl)).fetchone()
+                if row is None:
+                    self.stats["misses"] += 1
+                    return None
+                self._db.execute("UPDATE completions SET last_used = ? WHERE key = ?", (time.time(), key))
+                self._db.commit()
+                entry = row
+                self._remember(key, entry)
+                self.stats["disk_hits"] += 1
+            self.stats["saved_s"] += max(0.0, entry[2] - (time.perf_counter() - start))
+            return entry[0]
+
+    def put(self, model, messages, reply, latency=0.0):
+        key, now = self.key(model, messages), time.time()
+        with self._lock:
+            self._remember(key, (reply, now, latency))
+            self._db.executemany("UPDATE completions SET last_used = ? WHERE key = ?",
+                                 [(used, touched) for touched, used in self._touched.items()])
+            self._touched.clear()
+            self._db.execute("INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?, ?)", (key, reply, now, now, latency))
+            self._db.execute("DELETE FROM completions WHERE key NOT IN "
+                             "(SELECT key FROM completions ORDER BY last_used DESC LIMIT ?)", (self.max_disk_entries,))
+            self._db.commit()
+
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def metrics(self):
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        return {**self.stats, "hits": hits, "hit_rate": hits / lookups if lookups else 0.0}
+
+def make_token_counter(encoding="cl100k_base"):
+    """Local token counter: tiktoken when it is installed and its encoding is available, else ~4 chars/token."""
+    try:
+        import tiktoken
+        enc = tiktoken.get_encoding(encoding)
+        return lambda text: len(enc.encode(text))
+    except Exception:
+        return lambda text: max(1, len(text) // 4)
+
+def extractive_summary(messages, max_chars=600):
+    """Cheap local summary: the first sentence of each turn, keeping the most recent `max_chars`."""
+    firsts = [re.split(r"(?<=[.!?])\s", m["content"].strip(), maxsplit=1)[0] for m in messages]
+    parts = [f"{m['role']}: {first}" for m, first in zip(messages, firsts)]
+    return " | ".join(parts)[-max_chars:]
+
+class ContextWindow:
+    """Keep a conversation under `max_tokens` before it is sent upstream.
+
+    System messages and the last `keep_recent` messages are kept; older turns are kept
+    newest-first while they fit. Turns that do not fit are dropped, or replaced by one system
+    note from `summarize(dropped_messages)` (cut short if need be) when a summarizer is given.
+    If the system messages and recent turns alone are over budget, the recent turns shrink to
+    the newest user turn and the longest system messages (e.g. retrieved excerpts) are cut
+    short, so the result never exceeds `max_tokens`.
+    """
+    MESSAGE_OVERHEAD = 4  # role and separator tokens per message
+
+    def __init__(self, max_tokens=3000, keep_recent=4, count_tokens=None, summarize=extractive_summary):
+        self.max_tokens, self.keep_recent = max_tokens, keep_recent
+        self.count_tokens = count_tokens or make_token_counter()
+        self.summarize = summarize
+
+    def cost(self, messages):
+        return sum(self.count_tokens(m["content"]) + self.MESSAGE_OVERHEAD for m in messages)
+
+    def truncate(self, text, max_tokens):
+        """The longest prefix of `text` (marked with "...") that counts at most `max_tokens` tokens."""
+        if self.count_tokens(text) <= max_tokens:
+            return text
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.count_tokens(text[:mid] + "...") <= max_tokens:
+                lo = mid
+            else:
+                hi = mid - 1
+        return text[:lo] + "..." if lo else ""
+
+    def shrink(self, messages, budget):
+        """Cut the longest messages short (dropping any with no room left) until they cost at most `budget`."""
+        messages = list(messages)
+        while messages and self.cost(messages) > budget:
+            i = max(range(len(messages)), key=lambda j: self.count_tokens(messages[j]["content"]))
+            room = budget - self.cost(messages[:i] + messages[i + 1:]) - self.MESSAGE_OVERHEAD
+            text = self.truncate(messages[i]["content"], room) if room > 0 else None
+            if text is None or self.count_tokens(text) > room:
+                messages.pop(i)
+            else:
+                messages[i] = {**messages[i], "content": text}
+        return messages
+
+    def fit(self, messages):
+        pinned = [m for m in messages if m["role"] == "system"]
+        turns = [m for m in messages if m["role"] != "system"]
+        split = max(0, len(turns) - self.keep_recent)
+        newest_user = max((i for i, m in enumerate(turns) if m["role"] == "user"), default=len(turns) - 1)
+        while split < newest_user and self.cost(pinned + turns[split:]) > self.max_tokens:
+            split += 1
+        older, recent = turns[:split], turns[split:]
+        pinned = self.shrink(pinned, self.max_tokens - self.cost(recent))
+        recent = self.shrink(recent, self.max_tokens - self.cost(pinned))
+        budget = self.max_tokens - self.cost(pinned + recent)
+        kept = []
+        for m in reversed(older):
+            if self.cost([m]) + self.cost(kept) > budget:
+                break
+            kept.insert(0, m)
+        note = []
+        while self.summarize and len(kept) < len(older):
+            note = [{"role": "system", "content": "Summary of the earlier conversation: "
+                     + self.summarize(older[:len(older) - len(kept)])}]
+            if self.cost(note + kept) <= budget or not kept:
+                break
+            kept.pop(0)
+        note = self.shrink(note, budget)
+        return pinned + note + kept + recent
+
+def benchmark_context_window(context, client=None, lengths=(20, 100, 400)):
+    """Compare payload size (and upstream latency, given a client) for full vs. budgeted synthetic chats."""
+    for n in lengths:
+        messages = []
+        for i in range(n):
+            messages.append({"role": "user", "content": f"Question {i}: how does regularization affect model {i}? " * 3})
+            messages.append({"role": "assistant", "content": f"Answer {i}: it trades variance for bias in model {i}. " * 6})
+        fitted = context.fit(messages)
+        full_bytes, fitted_bytes = len(json.dumps(messages)), len(json.dumps(fitted))
+        line = (f"{2 * n:4d} messages: {full_bytes / 1e3:8.1f} kB -> {fitted_bytes / 1e3:6.1f} kB "
+                f"({context.cost(messages)} -> {context.cost(fitted)} tokens)")
+        if client is not None:
+            timings = []
+            for payload in (messages, fitted):
+                start = time.perf_counter()
+                try:
+                    client.complete(payload, max_tokens=1)
+                except ChatError:
+                    pass  # an error body still measures the round trip
+                timings.append(time.perf_counter() - start)
+            line += f", latency {timings[0]:.2f}s -> {timings[1]:.2f}s"
+        print(line)
+
+class TokenBucket:
+    """Async token bucket: `rate` acquisitions per second, bursting up to `capacity`."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate, self.capacity = rate, capacity
+        self.tokens, self.updated = capacity, time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def _read_jsonl(path, malformed=None):
+    """The records of a JSONL file; line numbers that do not parse are appended to `malformed`."""
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                if malformed is not None:
+                    malformed.append(number)
+
+def _ends_with_newline(path):
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+def _batch_messages(record):
+    """Chat messages for a batch record: `messages`, else `prompt`, else `title` + `body`."""
+    if "messages" in record:
+        return record["messages"]
+    prompt = record.get("prompt") or "\n\n".join(filter(None, (record.get("title"), record.get("body"))))
+    return [{"role": "user", "content": prompt}]
+
+async def run_batch(client, input_path, output_path, concurrency=8, rate=1.0, burst=1, id_key="request_id", **params):
+    """Run the chat requests in a JSONL file concurrently and append results to `output_path`.
+
+    At most `concurrency` requests are in flight and new ones start at no more than `rate`
+    per second. Each result is written as soon as it completes; ids that already have a
+    successful result in `output_path` are skipped, so an interrupted run can be resumed.
+    Input lines that are not valid JSON are counted as "malformed" and reported, not run.
+    """
+    done = set()
+    if os.path.exists(output_path):
+        # A line cut short by an interrupted run is simply not done yet.
+        done = {r["id"] for r in _read_jsonl(output_path) if "error" not in r}
+    malformed = []
+    pending = [r for r in _read_jsonl(input_path, malformed) if r[id_key] not in done]
+    if malformed:
+        print(f"batch: skipping {len(malformed)} malformed line(s) in {input_path}: "
+              f"{', '.join(map(str, malformed[:10]))}{' ...' if len(malformed) > 10 else ''}")
+    semaphore, bucket = asyncio.Semaphore(concurrency), TokenBucket(rate, burst)
+    counts = {"ok": 0, "error": 0, "skipped": len(done), "malformed": len(malformed)}
+
+    async def run_one(record, out):
+        async with semaphore:
+            await bucket.acquire()
+            start = time.perf_counter()
+            result = {"id": record[id_key]}
+            try:
+                reply, response = await asyncio.to_thread(client.complete, _batch_messages(record), **params)
+                if response.status_code == 200:
+                    result["reply"] = reply
+                    result["usage"] = response.json().get("usage")
+                else:
+                    result["error"] = reply
+            except Exception as exc:  # one bad record must not abort the batch
+                result["error"] = str(exc) if isinstance(exc, ChatError) else f"Error: {exc!r}"
+            result["latency_s"] = round(time.perf_counter() - start, 3)
+            counts["error" if "error" in result else "ok"] += 1
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+
+    start = time.perf_counter()
+    # Start on a fresh line if an interrupted run left its last record half-written.
+    needs_newline = os.path.exists(output_path) and not _ends_with_newline(output_path)
+    with open(output_path, "a") as out:
+        if needs_newline:
+            out.write("\n")
+        await asyncio.gather(*(run_one(record, out) for record in pending))
+    elapsed = time.perf_counter() - start
+    print(f"batch: {counts['ok']} ok, {counts['error']} failed, {counts['skipped']} already done "
+          f"in {elapsed:.1f}s ({len(pending) / max(elapsed, 1e-9):.2f} req/s)")
+    return counts
+
+def run_batch_sync(*args, **kwargs):
+    """run_batch from synchronous code, including notebooks that already run an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(run_batch(*args, **kwargs))
+    with ThreadPoolExecutor(1) as pool:
+        return pool.submit(asyncio.run, run_batch(*args, **kwargs)).result()
+
+def load_documents(root, patterns=("*.md", "*.txt", "*.ipynb")):
+    """{path: text} for the documents under `root`; notebooks contribute their cell sources."""
+    docs = {}
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(root, "**", pattern), recursive=True)):
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                if path.endswith(".ipynb"):
+                    try:
+                        cells = json.load(f).get("cells", [])
+                    except json.JSONDecodeError:
+                        continue
+                    docs[path] = "\n\n".join("".join(c.get("source", "")) for c in cells)
+                else:
+                    docs[path] = f.read()
+    return docs
+
+def chunk_text(text, chunk_words=150, overlap=30, max_word_chars=80):
+    """Split text into overlapping windows of `chunk_words` words, skipping blobs such as base64 images."""
+    words = [w for w in text.split() if len(w) <= max_word_chars]
+    if not words:
+        return []
+    step = chunk_words - overlap
+    return [" ".join(words[i:i + chunk_words]) for i in range(0, max(len(words) - overlap, 1), step)]
+
+class HashingEmbedder:
+    """Dependency-free embedder: hashed unigrams and bigrams with log term frequency, L2-normalized."""
+
+    def __init__(self, dim=2048):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def __call__(self, texts):
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            words = re.findall(r"\w+", text.lower())
+            for term in words + [a + " " + b for a, b in zip(words, words[1:])]:
+                out[row, zlib.crc32(term.encode()) % self.dim] += 1
+        out = np.log1p(out)
+        return out / np.maximum(np.linalg.norm(out, axis=1, keepdims=True), 1e-9)
+
+class SentenceEmbedder:
+    """Small local sentence-transformers model; needs the optional sentence-transformers package."""
+
+    def __init__(self, model_name="sentence-transformers/all-MiniLM-L6-v2"):
+        from sentence_transformers import SentenceTransformer
+        self.model, self.name = SentenceTransformer(model_name), model_name
+
+    def __call__(self, texts):
+        return self.model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+
+def make_embedder():
+    try:
+        return SentenceEmbedder()
+    except Exception:
+        return HashingEmbedder()
+
+class VectorIndex:
+    """Persistent cosine-similarity index: embeddings.npy plus chunks.json under `path`.
+
+    `build` reuses the stored index when the corpus and embedder are unchanged.
+    """
+
+    def __init__(self, path, embedder):
+        self.path, self.embedder = path, embedder
+        self.chunks, self.embeddings = [], np.zeros((0, 0), dtype=np.float32)
+
+    def build(self, docs, chunk_words=150, overlap=30):
+        digest = hashlib.sha256(json.dumps([self.embedder.name, chunk_words, overlap, sorted(docs.items())]).encode()).hexdigest()
+        meta_path = os.path.join(self.path, "chunks.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta["digest"] == digest:
+                self.chunks = meta["chunks"]
+                self.embeddings = np.load(os.path.join(self.path, "embeddings.npy"), mmap_mode="r")
+                return self
+        start = time.perf_counter()
+        self.chunks = [{"source": path, "text": chunk}
+                       for path, text in docs.items() for chunk in chunk_text(text, chunk_words, overlap)]
+        self.embeddings = self.embedder([c["text"] for c in self.chunks])
+        os.makedirs(self.path, exist_ok=True)
+        np.save(os.path.join(self.path, "embeddings.npy"), self.embeddings)
+        with open(meta_path, "w") as f:
+            json.dump({"digest": digest, "embedder": self.embedder.name, "chunks": self.chunks}, f)
+        print(f"Indexed {len(self.chunks)} chunks from {len(docs)} documents in {time.perf_counter() - start:.2f}s")
+        return self
+
+    def search(self, query, k=4):
+        """Top-k (score, chunk) pairs for `query`."""
+        if not self.chunks:
+            return []
+        scores = np.asarray(self.embeddings @ self.embedder([query])[0])
+        top = np.argsort(-scores)[:k]
+        return [(float(scores[i]), self.chunks[i]) for i in top]
+
+    def context_message(self, query, k=4):
+        """A system message carrying the top-k chunks for `query`, or None if the index is empty."""
+        hits = self.search(query, k)
+        if not hits:
+            return None
+        excerpts = "\n\n".join(f"[{c['source']}]\n{c['text']}" for _, c in hits)
+        return {"role": "system", "content": "Answer using these excerpts where relevant:\n\n" + excerpts}
+
+def benchmark_retrieval(index, docs, queries, context, k=4):
+    """Report query latency and prompt tokens for top-k retrieval vs pasting the whole corpus."""
+    full_tokens = context.cost([{"role": "system", "content": "\n\n".join(docs.values())}])
+    latencies, tokens = [], []
+    for query in queries:
+        start = time.perf_counter()
+        message = index.context_message(query, k)
+        latencies.append(time.perf_counter() - start)
+        tokens.append(context.cost([message]) if message else 0)
+    print(f"retrieval: {1e3 * np.median(latencies):.2f} ms median query latency, "
+          f"{np.mean(tokens):.0f} prompt tokens vs {full_tokens} for the full corpus "
+          f"({100 * (1 - np.mean(tokens) / max(full_tokens, 1)):.1f}% saved)")
+
+def make_chat_handler(client, cache, context, index=None):
+    """The Gradio callback: retrieval, context budgeting, cache lookup, then a streamed reply."""
+    def chat_with_model(user_input, chat_history):
+        # Prepare messages for API
+        messages = []
+        for role, content in chat_history:
+            messages.append({"role": role, "content": content})
+        messages.append({"role": "user", "content": user_input})
+        retrieved = index.context_message(user_input) if index is not None else None
+        if retrieved:
+            messages.insert(0, retrieved)
+        messages = context.fit(messages)
+
+        chat_history.append(("user", user_input))
+        reply = cache.get(client.model, messages)
+        if reply is not None:
+            chat_history.append(("assistant", reply))
+            yield chat_history, chat_history
+            return
+
+        # Stream the reply into the chatbot as it arrives; the assistant turn is added with the
+        # first delta, so a request that never opens leaves no empty turn in the history.
+        reply, start, opened = "", time.perf_counter(), False
+        try:
+            for delta in client.stream(messages):
+                if not opened:
+                    chat_history.append(("assistant", ""))
+                    opened = True
+                reply += delta
+                chat_history[-1] = ("assistant", reply)
+                yield chat_history, chat_history
+        except ChatError as e:
+            if opened:
+                chat_history[-1] = ("assistant", str(e))
+            else:
+                chat_history.append(("assistant", str(e)))
+        else:
+            if not opened:
+                chat_history.append(("assistant", reply))
+            cache.put(client.model, messages, reply, latency=time.perf_counter() - start)
+        yield chat_history, chat_history
+    return chat_with_model
+
+def build_demo(chat_with_model):
+    import gradio as gr
+    with gr.Blocks() as demo:
+        chat = gr.Chatbot()
+        msg = gr.Textbox(placeholder="Ask a question...")
+        state = gr.State([])  # stores the conversation as list of tuples (role, content)
+
+        msg.submit(chat_with_model, inputs=[msg, state], outputs=[chat, state])
+    return demo
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab chat", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="openai/gpt-oss-20b:free")
+    parser.add_argument("--docs", default=".", help="directory of documents to retrieve from")
+    parser.add_argument("--no-retrieval", action="store_true")
+    parser.add_argument("--max-context-tokens", type=int, default=3000)
+    parser.add_argument("--benchmark", action="store_true", help="report context-window and retrieval savings, then exit")
+    parser.add_argument("--batch", metavar="JSONL", help="run the chat requests in JSONL instead of serving the UI")
+    parser.add_argument("--out", default="chat_batch_results.jsonl", help="results file for --batch")
+    parser.add_argument("--concurrency", type=int, default=4)
+    # The free tier allows roughly 20 requests per minute.
+    parser.add_argument("--rate", type=float, default=0.3, help="requests started per second for --batch")
+    args = parser.parse_args(argv)
+
+    client = ChatClient(openrouter_api_key(), model=args.model)
+    if args.batch:
+        # Bulk offline evaluation.
+        run_batch_sync(client, args.batch, args.out, concurrency=args.concurrency, rate=args.rate, max_tokens=512)
+        return
+
+    cache = CompletionCache("chat_cache.sqlite", normalize=True)
+    context = ContextWindow(max_tokens=args.max_context_tokens, keep_recent=4)
+    index = None
+    if not args.no_retrieval:
+        # Retrieval over local documents (the lab notebooks by default; point --docs at your own corpus).
+        docs = load_documents(args.docs)
+        index = VectorIndex("qa_index", make_embedder()).build(docs)
+    if args.benchmark:
+        benchmark_context_window(context, client)
+        if index is not None:
+            benchmark_retrieval(index, docs, ["How is the VAE loss computed?", "What does the GAN discriminator do?",
+                                              "How are LoRA adapters swapped?"], context)
+        return
+
+    build_demo(make_chat_handler(client, cache, context, index)).queue().launch()
@@ -0,0 +1,255 @@
+"""Asynchronous, resumable checkpoints shared by the long-running training loops."""
+
+import os
+import json
+import time
+import random
+import shutil
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import tensorflow as tf
+import keras
+
+from .telemetry import TELEMETRY_DIR
+
+CHECKPOINT_DIR = "checkpoints"
+# Options that only set how long a run is or how it is checkpointed, so they don't key its directory.
+RUN_LENGTH_ARGS = ("epochs", "steps", "checkpoint_dir", "checkpoint_every", "fresh")
+
+def add_checkpoint_args(parser, every, unit):
+    parser.add_argument("--checkpoint-dir", default=CHECKPOINT_DIR, help="where to save and resume training state")
+    parser.add_argument("--checkpoint-every", type=int, default=every, help=f"{unit} between checkpoints")
+    parser.add_argument("--fresh", action="store_true", help="discard this configuration's checkpoints and start over")
+
+def run_config(args, ignore=()):
+    """The command-line settings that identify a run: everything but its length and checkpoint options."""
+    return {k: v for k, v in sorted(vars(args).items()) if k not in RUN_LENGTH_ARGS + tuple(ignore)}
+
+class RandomState(tf.train.experimental.PythonState):
+    """NumPy's and Python's global RNG state, so a resumed run continues the same random streams.
+
+    Stateful tf.random ops seeded through tf.random.set_seed keep their counters inside the
+    kernels and cannot be saved; they restart their sequence after a resume.
+    """
+
+    def serialize(self):
+        name, keys, pos, has_gauss, cached = np.random.get_state()
+        version, state, gauss = random.getstate()
+        return json.dumps({"numpy": [name, keys.tolist(), pos, has_gauss, cached],
+                           "python": [version, list(state), gauss]})
+
+    def deserialize(self, string_value):
+        s = json.loads(string_value)
+        name, keys, pos, has_gauss, cached = s["numpy"]
+        np.random.set_state((name, np.array(keys, np.uint32), pos, has_gauss, cached))
+        version, state, gauss = s["python"]
+        random.setstate((version, tuple(state), gauss))
+
+class _FrozenState(tf.train.experimental.PythonState):
+    """The serialized value of a PythonState taken at snapshot time; restores go to the original."""
+
+    def __init__(self, source):
+        self.source, self.value = source, None
+
+    def serialize(self):
+        return self.value
+
+    def deserialize(self, string_value):
+        self.source.deserialize(string_value)
+
+class TrainingCheckpoint:
+    """Saves models, optimizers, step/epoch position and RNG state without stalling the training loop.
+
+    Pass the objects to save as keyword arguments (or later through `track`), call `restore()`
+    before training and resume from `checkpoint.epoch` / `checkpoint.step`, then call `end_step()`
+    after every update and `end_epoch()` after every epoch; a save is due every `every_steps`
+    steps, `every_epochs` epochs or `every_seconds` seconds. Keras fit takes `checkpoint.callback()`.
+
+    A save copies every variable into a host-side mirror of the checkpoint's object graph on the
+    training thread, then a background thread writes the mirror through a CheckpointManager, which
+    names checkpoints by step and applies the retention policy (`max_to_keep`, plus one checkpoint
+    kept every `keep_every_hours`). The next save waits for the previous write, so at most one is in
+    flight. (TensorFlow's experimental async checkpointing does the same, but fails on the second
+    save of Keras 3 variables.) Epoch-based loops resume at the last finished epoch; step-based
+    loops over a repeated, shuffled dataset resume at the saved step with a fresh shuffle.
+
+    Runs are kept apart by `config` (e.g. `run_config(args)`): its hash is part of the directory,
+    so changing a hyperparameter starts a new run instead of resuming (or failing to restore) an
+    old one, while asking for more epochs or steps continues the same run. `fresh=True` deletes
+    the run's checkpoints before training. With `directory=None` nothing is written or restored,
+    so loops can take an optional checkpoint the same way they take an optional telemetry.
+    """
+
+    def __init__(self, name, directory=CHECKPOINT_DIR, every_steps=None, every_epochs=1, every_seconds=None,
+                 max_to_keep=3, keep_every_hours=None, config=None, fresh=False, **trackables):
+        self.config, self.fresh = config, fresh
+        if directory and config:
+            digest = hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()[:8]
+            directory = os.path.join(directory, f"{name}-{digest}")
+        elif directory:
+            directory = os.path.join(directory, name)
+        self.name, self.directory = name, directory
+        self.every_steps, self.every_epochs, self.every_seconds = every_steps, every_epochs, every_seconds
+        self.max_to_keep, self.keep_every_hours = max_to_keep, keep_every_hours
+        self.step = self.epoch = 0
+        self.step_var = tf.Variable(0, dtype=tf.int64, trainable=False)
+        self.epoch_var = tf.Variable(0, dtype=tf.int64, trainable=False)
+        self.checkpoint = tf.train.Checkpoint(step=self.step_var, epoch=self.epoch_var, rng=RandomState())
+        self.track(**trackables)
+        self.mirror = self.manager = None
+        self.pairs, self.frozen = [], []
+        self.executor, self.pending = ThreadPoolExecutor(max_workers=1), None
+        self.saved_step, self.last_save = None, time.perf_counter()
+        self.started, self.resumed_from = time.perf_counter(), None
+        self.blocking_times, self.write_times = [], []
+
+    def track(self, **trackables):
+        """Add objects to the checkpoint; call before `restore()` and the first save."""
+        for key, value in trackables.items():
+            setattr(self.checkpoint, key, value)
+
+    def restore(self, epochs=None, steps=None):
+        """Restore the latest checkpoint, if any, and return its path.
+
+        Variables that do not exist yet (optimizer slots before the first update) are restored
+        as soon as they are created. `epochs`/`steps` is the requested run length, used only to
+        say so when the checkpoint already covers it.
+        """
+        if self.fresh and self.directory and os.path.isdir(self.directory):
+            shutil.rmtree(self.directory)
+            print(f"[{self.name}] discarded the checkpoints in {self.directory}")
+        latest = self.directory and tf.train.latest_checkpoint(self.directory)
+        if latest:
+            self.checkpoint.restore(latest).expect_partial()
+            self.step, self.epoch = int(self.step_var.numpy()), int(self.epoch_var.numpy())
+            self.saved_step, self.resumed_from = self.step, latest
+            print(f"[{self.name}] resumed from {latest} at epoch {self.epoch}, step {self.step}")
+            if (epochs is not None and self.epoch >= epochs) or (steps is not None and self.step >= steps):
+                print(f"[{self.name}] this run is already complete; pass --fresh (or fresh=True) to train it again")
+        self.started = self.last_save = time.perf_counter()
+        return latest
+
+    def end_step(self):
+        self.step += 1
+        if (self.every_steps and self.step % self.every_steps == 0) or \
+                (self.every_seconds and time.perf_counter() - self.last_save >= self.every_seconds):
+            self.save()
+
+    def end_epoch(self):
+        self.epoch += 1
+        if self.every_epochs and self.epoch % self.every_epochs == 0:
+            self.save()
+
+    def callback(self):
+        return CheckpointCallback(self)
+
+    @staticmethod
+    def _is_variable(obj):
+        return isinstance(obj, (tf.Variable, keras.Variable))
+
+    def _mirror(self, obj, seen):
+        """A copy of `obj`'s checkpoint object graph whose variables live on the host."""
+        if id(obj) in seen:
+            return seen[id(obj)]
+        if self._is_variable(obj):
+            with tf.device("CPU:0"):
+                node = tf.Variable(tf.zeros(obj.shape, obj.dtype), trainable=False)
+            self.pairs.append((node, obj.value if isinstance(obj, keras.Variable) else obj))
+        elif isinstance(obj, tf.train.experimental.PythonState):
+            node = _FrozenState(obj)
+            self.frozen.append(node)
+        else:
+            node = tf.train.Checkpoint()
+            seen[id(obj)] = node
+            for child_name, child in tf.train.TrackableView(obj).children(obj).items():
+                if child_name != "save_counter":  # the mirror's manager keeps its own
+                    setattr(node, child_name, self._mirror(child, seen))
+        seen[id(obj)] = node
+        return node
+
+    def save(self):
+        """Snapshot the tracked state and write it in the background; returns the pending write."""
+        if not self.directory:
+            return None
+        start = time.perf_counter()
+        self.wait()
+        self.step_var.assign(self.step)
+        self.epoch_var.assign(self.epoch)
+        if self.mirror is None:
+            # Built at the first save, once the first update has created the optimizer's slots.
+            self.mirror = self._mirror(self.checkpoint, {})
+            self.manager = tf.train.CheckpointManager(self.mirror, self.directory, max_to_keep=self.max_to_keep,
+                                                      keep_checkpoint_every_n_hours=self.keep_every_hours)
+            if self.config:
+                os.makedirs(self.directory, exist_ok=True)
+                with open(os.path.join(self.directory, "config.json"), "w") as f:
+                    json.dump(self.config, f, indent=2, default=str)
+        for copy, variable in self.pairs:
+            copy.assign(variable)
+        for state in self.frozen:
+            state.value = state.source.serialize()
+        self.pending = self.executor.submit(self._write, self.step)
+        self.saved_step, self.last_save = self.step, time.perf_counter()
+        self.blocking_times.append(self.last_save - start)
+        return self.pending
+
+    def _write(self, step):
+        start = time.perf_counter()
+        path = self.manager.save(checkpoint_number=step)
+        self.write_times.append(time.perf_counter() - start)
+        return path
+
+    def wait(self):
+        """Block until the write in flight, if any, has finished (and re-raise its error)."""
+        if self.pending is not None:
+            pending, self.pending = self.pending, None
+            return pending.result()
+
+    def close(self):
+        """Save any progress since the last checkpoint and wait for the write to finish."""
+        if self.directory and self.saved_step != self.step:
+            self.save()
+        path = self.wait()
+        self.executor.shutdown()
+        return path
+
+    def summary(self):
+        blocking, writes = np.array(self.blocking_times or [0.0]), np.array(self.write_times or [0.0])
+        wall = time.perf_counter() - self.started
+        return {
+            "name": self.name,
+            "saves": len(self.blocking_times),
+            "resumed_from": self.resumed_from,
+            "latest": self.manager.latest_checkpoint if self.manager else self.resumed_from,
+            "blocking_s": {"total": float(sum(self.blocking_times)), "mean": float(blocking.mean()),
+                           "max": float(blocking.max())},
+            "background_write_s": {"total": float(sum(self.write_times)), "mean": float(writes.mean())},
+            "blocking_fraction": float(sum(self.blocking_times)) / wall if wall else 0.0,
+        }
+
+    def report(self, out_dir=TELEMETRY_DIR):
+        """Print the checkpointing overhead and write <name>.checkpoint.json under `out_dir`."""
+        if not self.directory:
+            return None
+        s = self.summary()
+        os.makedirs(out_dir, exist_ok=True)
+        with open(os.path.join(out_dir, f"{self.name}.checkpoint.json"), "w") as f:
+            json.dump(s, f, indent=2)
+        print(f"[{self.name}] {s['saves']} checkpoints to {self.directory}, "
+              f"blocking {1e3 * s['blocking_s']['mean']:.1f} ms per save ({100 * s['blocking_fraction']:.2f}% of wall time), "
+              f"{1e3 * s['background_write_s']['mean']:.1f} ms per write in the background")
+        return s
+
+class CheckpointCallback(tf.keras.callbacks.Callback):
+    """Drives a TrainingCheckpoint from Model.fit; pass `initial_epoch=checkpoint.epoch` to fit."""
+
+    def __init__(self, checkpoint):
+        super().__init__()
+        self.checkpoint = checkpoint
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.checkpoint.end_step()
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.checkpoint.end_epoch()
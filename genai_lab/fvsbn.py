@@ -0,0 +1,124 @@
+"""4) Implement a basic autoregressive model like the Fully Visible Sigmoid Belief Network (FVSBN) and train it on a dataset like MNIST."""
+
+import argparse
+
+import tensorflow as tf
+import tensorflow_probability as tfp
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .telemetry import TrainingTelemetry
+from .checkpoint import TrainingCheckpoint, add_checkpoint_args, run_config
+
+class FVSBNLayer(tf.keras.layers.Layer):
+    """Custom layer for FVSBN autoregressive computation."""
+    def __init__(self, dim):
+        super(FVSBNLayer, self).__init__()
+        self.dim = dim
+        self.mask = tf.constant(np.tril(np.ones((dim, dim)), k=-1), dtype=tf.float32)
+
+    def build(self, input_shape):
+        self.kernel = self.add_weight(name="kernel", shape=(self.dim, self.dim), initializer="random_normal")
+        self.bias = self.add_weight(name="bias", shape=(self.dim,), initializer="zeros")
+
+    def call(self, inputs):
+        masked_kernel = self.kernel * self.mask
+        logits = tf.matmul(inputs, masked_kernel, transpose_b=True) + self.bias
+        return logits
+
+class FVSBN(tf.keras.Model):
+    """FVSBN model for binary data."""
+    def __init__(self, dim):
+        super(FVSBN, self).__init__()
+        self.dim = dim
+        self.layer = FVSBNLayer(dim)
+
+    def call(self, inputs):
+        logits = self.layer(inputs)
+        return tf.nn.sigmoid(logits)
+
+    def compute_loss(self, inputs):
+        logits = self.layer(inputs)
+        return tf.keras.losses.BinaryCrossentropy(from_logits=True)(inputs, logits)
+
+    def sample(self, num_samples):
+        samples = tf.zeros((num_samples, self.dim), dtype=tf.float32)
+        for i in range(self.dim):
+            probs = self(samples)[:, i]
+            samples_i = tfp.distributions.Bernoulli(probs=probs).sample()
+            samples = tf.tensor_scatter_nd_update(samples, [[j, i] for j in range(num_samples)], tf.cast(samples_i, tf.float32))
+        return samples
+
+def load_mnist_data():
+    """Load and binarize MNIST data."""
+    (x_train, _), (x_test, _) = tf.keras.datasets.mnist.load_data()
+    x_train = (x_train / 255.0) > 0.5  # Binarize
+    x_test = (x_test / 255.0) > 0.5
+    x_train = x_train.reshape(-1, 784).astype(np.float32)
+    x_test = x_test.reshape(-1, 784).astype(np.float32)
+    return x_train[:10000], x_test[:1000]  # Subset for faster training
+
+def train_fvsbn(model, data, epochs=200, batch_size=128, learning_rate=0.001, telemetry=None, checkpoint=None):
+    """Train the FVSBN model."""
+    telemetry = telemetry or TrainingTelemetry("fvsbn")
+    checkpoint = checkpoint or TrainingCheckpoint("fvsbn", directory=None)
+    optimizer = tf.keras.optimizers.Adam(learning_rate)
+    checkpoint.track(model=model, optimizer=optimizer)
+    checkpoint.restore(epochs=epochs)
+    dataset = tf.data.Dataset.from_tensor_slices(data).shuffle(10000).batch(batch_size)
+    for epoch in range(checkpoint.epoch, epochs):
+        total_loss = 0
+        for batch in telemetry.iterate(dataset):
+            with telemetry.step(len(batch)):
+                with tf.GradientTape() as tape:
+                    loss = model.compute_loss(batch)
+                gradients = tape.gradient(loss, model.trainable_variables)
+                optimizer.apply_gradients(zip(gradients, model.trainable_variables))
+                total_loss += loss.numpy()
+            checkpoint.end_step()
+        if (epoch + 1) % 2 == 0:
+            print(f"Epoch {epoch + 1}, Loss: {total_loss / len(dataset):.4f}")
+        checkpoint.end_epoch()
+    checkpoint.close()
+    telemetry.report()
+    checkpoint.report()
+
+def visualize_samples(samples, title="Generated MNIST Samples"):
+    """Visualize generated samples as 28x28 images."""
+    samples = samples.numpy().reshape(-1, 28, 28)
+    plt.figure(figsize=(10, 2))
+    for i in range(5):
+        plt.subplot(1, 5, i + 1)
+        plt.imshow(samples[i], cmap="binary")
+        plt.axis("off")
+    plt.suptitle(title)
+    plt.show()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab fvsbn", description=__doc__)
+    parser.add_argument("--epochs", type=int, default=200)
+    add_checkpoint_args(parser, every=10, unit="epochs")
+    args = parser.parse_args(argv)
+
+    # Set random seed for reproducibility
+    tf.random.set_seed(42)
+    np.random.seed(42)
+
+    # Load data
+    dim = 28 * 28  # MNIST image size
+    x_train, x_test = load_mnist_data()
+
+    # Initialize and train model
+    model = FVSBN(dim=dim)
+    checkpoint = TrainingCheckpoint("fvsbn", args.checkpoint_dir, every_epochs=args.checkpoint_every,
+                                    config=run_config(args), fresh=args.fresh)
+    train_fvsbn(model, x_train, epochs=args.epochs, checkpoint=checkpoint)
+
+    # Evaluate on a test sample
+    test_sample = x_test[:1]
+    log_prob = -model.compute_loss(test_sample) * dim
+    print(f"Log probability of test image: {log_prob.numpy():.4f}")
+
+    # Generate and visualize samples
+    samples = model.sample(5)
+    visualize_samples(samples)
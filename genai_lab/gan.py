@@ -0,0 +1,140 @@
+"""7) Implement a Vanilla GAN using TensorFlow or PyTorch and train it on a dataset like MNIST for image generation."""
+
+import argparse
+
+import tensorflow as tf
+from tensorflow import keras
+from tensorflow.keras import layers
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .telemetry import TrainingTelemetry
+from .checkpoint import TrainingCheckpoint, add_checkpoint_args, run_config
+
+# Config
+SEED = 42
+EPOCHS = 50
+BATCH_SIZE = 256
+NOISE_DIM = 100
+LR = 2e-4
+BETA_1 = 0.5
+
+# Data
+def load_dataset(batch_size=BATCH_SIZE):
+    (x_train, _), _ = keras.datasets.mnist.load_data()
+    x_train = (x_train.astype('float32') - 127.5) / 127.5
+    x_train = np.expand_dims(x_train, -1)
+    return tf.data.Dataset.from_tensor_slices(x_train).shuffle(60000).batch(batch_size)
+
+# Generator
+def build_generator():
+    return keras.Sequential([
+        layers.Dense(7*7*256, use_bias=False, input_shape=(NOISE_DIM,)),
+        layers.BatchNormalization(),
+        layers.ReLU(),
+        layers.Reshape((7,7,256)),
+        layers.Conv2DTranspose(128, 5, strides=1, padding='same', use_bias=False),
+        layers.BatchNormalization(),
+        layers.ReLU(),
+        layers.Conv2DTranspose(64, 5, strides=2, padding='same', use_bias=False),
+        layers.BatchNormalization(),
+        layers.ReLU(),
+        layers.Conv2DTranspose(1, 5, strides=2, padding='same', use_bias=False, activation='tanh')
+    ])
+
+# Discriminator
+def build_discriminator():
+    return keras.Sequential([
+        layers.Conv2D(64, 5, strides=2, padding='same', input_shape=(28,28,1)),
+        layers.LeakyReLU(0.2),
+        layers.Dropout(0.3),
+        layers.Conv2D(128, 5, strides=2, padding='same'),
+        layers.LeakyReLU(0.2),
+        layers.Dropout(0.3),
+        layers.Flatten(),
+        layers.Dense(1, activation='sigmoid')
+    ])
+
+# Losses
+bce = keras.losses.BinaryCrossentropy()
+
+def d_loss(real_out, fake_out):
+    real_loss = bce(tf.ones_like(real_out)*0.9, real_out)  # label smoothing
+    fake_loss = bce(tf.zeros_like(fake_out), fake_out)
+    return real_loss + fake_loss
+
+def g_loss(fake_out):
+    return bce(tf.ones_like(fake_out), fake_out)
+
+# Training step
+def make_train_step(generator, discriminator, g_opt, d_opt):
+    @tf.function
+    def train_step(real_imgs):
+        noise = tf.random.normal([real_imgs.shape[0], NOISE_DIM])
+        with tf.GradientTape() as gt, tf.GradientTape() as dt:
+            fake_imgs = generator(noise, training=True)
+            real_out = discriminator(real_imgs, training=True)
+            fake_out = discriminator(fake_imgs, training=True)
+            gl = g_loss(fake_out)
+            dl = d_loss(real_out, fake_out)
+        g_grads = gt.gradient(gl, generator.trainable_variables)
+        d_grads = dt.gradient(dl, discriminator.trainable_variables)
+        g_opt.apply_gradients(zip(g_grads, generator.trainable_variables))
+        d_opt.apply_gradients(zip(d_grads, discriminator.trainable_variables))
+        return gl, dl
+    return train_step
+
+# Plotting generated images
+def sample_images(generator, seed, epoch):
+    preds = generator(seed, training=False)
+    plt.figure(figsize=(5,5))
+    for i in range(25):
+        plt.subplot(5,5,i+1)
+        img = (preds[i] + 1) / 2.0
+        plt.imshow(img.numpy().squeeze(), cmap='gray')
+        plt.axis('off')
+    plt.suptitle(f'Epoch {epoch}')
+    plt.tight_layout()
+    plt.show()
+
+# Training loop
+def train(generator, train_step, train_ds, epochs=EPOCHS, telemetry=None, checkpoint=None):
+    telemetry = telemetry or TrainingTelemetry("gan")
+    checkpoint = checkpoint or TrainingCheckpoint("gan", directory=None)
+    checkpoint.restore(epochs=epochs)
+    seed = tf.random.normal([25, NOISE_DIM])
+    for epoch in range(checkpoint.epoch + 1, epochs+1):
+        for real_batch in telemetry.iterate(train_ds):
+            with telemetry.step(real_batch.shape[0]):
+                gl, dl = train_step(real_batch)
+            checkpoint.end_step()
+        if epoch % 5 == 0 or epoch == 1 or epoch == epochs:
+            print(f'Epoch {epoch} - G Loss: {gl:.4f}, D Loss: {dl:.4f}')
+            sample_images(generator, seed, epoch)
+        checkpoint.end_epoch()
+    checkpoint.close()
+    telemetry.report()
+    checkpoint.report()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab gan", description=__doc__)
+    parser.add_argument("--epochs", type=int, default=EPOCHS)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    add_checkpoint_args(parser, every=1, unit="epochs")
+    args = parser.parse_args(argv)
+
+    np.random.seed(SEED)
+    tf.random.set_seed(SEED)
+
+    generator = build_generator()
+    discriminator = build_discriminator()
+    g_opt = keras.optimizers.Adam(LR, beta_1=BETA_1)
+    d_opt = keras.optimizers.Adam(LR, beta_1=BETA_1)
+
+    # Run
+    checkpoint = TrainingCheckpoint("gan", args.checkpoint_dir, every_epochs=args.checkpoint_every,
+                                    config=run_config(args), fresh=args.fresh, generator=generator,
+                                    discriminator=discriminator, g_opt=g_opt, d_opt=d_opt)
+    train(generator, make_train_step(generator, discriminator, g_opt, d_opt), load_dataset(args.batch_size), args.epochs,
+          checkpoint=checkpoint)
+    print("Training completed!")
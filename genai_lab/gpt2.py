@@ -0,0 +1,464 @@
+"""11) Fine-tune a pre-trained GPT model on a specific task such as sentiment analysis using a dataset like IMDB reviews."""
+
+import os
+import argparse
+import json
+import time
+import queue
+import shutil
+import hashlib
+import tempfile
+import threading
+from itertools import islice
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+import tensorflow as tf
+from transformers import GPT2TokenizerFast, TFGPT2ForSequenceClassification
+
+from .telemetry import TrainingTelemetry
+
+texts = [
+ "I love this movie, it was fantastic!",
+ "Absolutely wonderful experience, would recommend!",
+ "Terrible movie, I hated every moment.",
+ "Worst film ever, waste of time.",
+ "The acting was brilliant and touching.",
+ "Awful plot and bad direction.",
+ "A great story and strong performances.",
+ "It was boring and too long."
+]
+labels = [1,1,0,0,1,0,1,0]
+trn_texts, tst_texts = texts[:6], texts[6:]
+trn_labels, tst_labels = labels[:6], labels[6:]
+
+def load_gpt2_classifier(mname, num_labels=2, cache_dir="gpt2_model_cache"):
+    """Load the fast tokenizer and TF classifier from a local cache, converting from PyTorch only once.
+
+    The first run converts the PyTorch checkpoint and saves TF weights as safetensors
+    (memory-mapped on load) next to the tokenizer files; later runs load that directory
+    fully offline. The files are written to a temporary directory that is renamed into place
+    last, so an interrupted conversion never leaves a half-written cache behind.
+    """
+    start = time.perf_counter()
+    path = os.path.join(cache_dir, f"{mname.replace('/', '--')}-{num_labels}")
+    if os.path.exists(os.path.join(path, "config.json")):
+        tok = GPT2TokenizerFast.from_pretrained(path, local_files_only=True)
+        model = TFGPT2ForSequenceClassification.from_pretrained(path, local_files_only=True, use_safetensors=True)
+        source = "local cache"
+    else:
+        tok = GPT2TokenizerFast.from_pretrained(mname)
+        tok.pad_token = tok.eos_token
+        model = TFGPT2ForSequenceClassification.from_pretrained(mname, num_labels=num_labels, from_pt=True)
+        model.config.pad_token_id = tok.eos_token_id
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=cache_dir)
+        try:
+            tok.save_pretrained(tmp)
+            model.save_pretrained(tmp, safe_serialization=True)
+            if not os.path.exists(os.path.join(path, "config.json")):
+                shutil.rmtree(path, ignore_errors=True)  # leftovers of an older, interrupted write
+            os.replace(tmp, path)
+        except OSError:
+            if not os.path.exists(os.path.join(path, "config.json")):
+                raise
+            # another process finished the same conversion first
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+        source = "converted from PyTorch"
+    print(f"Loaded {mname} ({source}) in {time.perf_counter() - start:.2f}s")
+    return tok, model
+
+def enc(tok, txts):
+    return tok(txts, truncation=True, padding=True, max_length=64, return_tensors="tf")
+
+def tokenize_cached(tok, txts, lbls, max_length=64, cache_dir="gpt2_token_cache"):
+    """Tokenize once without padding and keep the ragged ids on disk, keyed by tokenizer, length cap and data."""
+    key = json.dumps([tok.name_or_path, len(tok), max_length, list(txts), list(lbls)])
+    path = os.path.join(cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest()[:16])
+    if os.path.exists(path):
+        return tf.data.Dataset.load(path)
+    ids = tok(list(txts), truncation=True, max_length=max_length)["input_ids"]
+    ragged, labels = tf.ragged.constant(ids, dtype=tf.int32), tf.constant(lbls, tf.int32)
+    ds = tf.data.Dataset.range(len(ids)).map(lambda i: (ragged[i], labels[i]))
+    ds.save(path)
+    return ds
+
+def bucketed_batches(ds, batch_size, pad_token_id, max_length=64, bucket_width=4, shuffle_buffer=0):
+    """Group examples of similar length and pad each batch only up to its length bucket.
+
+    Batches are padded to the bucket boundary rather than the exact batch maximum so that
+    only max_length / bucket_width distinct shapes reach the compiled train step.
+    """
+    if shuffle_buffer:
+        ds = ds.shuffle(shuffle_buffer)
+    boundaries = list(range(bucket_width, max_length, bucket_width)) + [max_length + 1]
+    ds = ds.bucket_by_sequence_length(lambda ids, y: tf.shape(ids)[0], boundaries,
+                                      [batch_size] * (len(boundaries) + 1), padding_values=(-1, 0),
+                                      pad_to_bucket_boundary=True)
+    def to_features(ids, y):
+        return {"input_ids": tf.where(ids >= 0, ids, pad_token_id),
+                "attention_mask": tf.cast(ids >= 0, tf.int32)}, y
+    return ds.map(to_features).prefetch(tf.data.AUTOTUNE)
+
+def padding_report(name, ds, model):
+    """Run forward passes over ds and print the padding ratio and real (non-pad) tokens/sec."""
+    real = total = 0
+    start = time.perf_counter()
+    for features, _ in ds:
+        model(features, training=False)
+        mask = features["attention_mask"]
+        real += int(tf.reduce_sum(mask))
+        total += int(tf.size(mask))
+    elapsed = time.perf_counter() - start
+    print(f"{name}: padding {1 - real / total:.1%}, {real / elapsed:.0f} real tokens/s")
+
+loss = tf.keras.losses.SparseCategoricalCrossentropy(from_logits=True)
+# model.fit/evaluate relax their traced input signature to an unknown sequence length once
+# a second batch shape appears, and TFGPT2ForSequenceClassification cannot be traced that
+# way. These steps retrace once per bucket shape instead.
+def make_train_step(model, variables, optimizer, accumulate_steps=1, loss_scale=False):
+    """Compiled train step that updates only `variables`; everything else stays frozen.
+
+    With accumulate_steps=K the gradients of K consecutive micro-batches are averaged in
+    accumulator variables and applied once, growing the effective batch without growing
+    activation memory. Call `fit_step.flush()` at the end of every epoch to apply a final
+    partial accumulation (averaged over the micro-batches it actually holds).
+    loss_scale=True wraps the optimizer in a dynamic LossScaleOptimizer for models built
+    under the "mixed_float16" policy.
+    """
+    optimizer.build(variables)
+    if loss_scale:
+        optimizer = tf.keras.mixed_precision.LossScaleOptimizer(optimizer)
+    accumulators = [tf.Variable(tf.zeros_like(v), trainable=False) for v in variables] if accumulate_steps > 1 else None
+
+    @tf.function
+    def grad_step(features, labels):
+        with tf.GradientTape() as tape:
+            logits = tf.cast(model(features, training=True).logits, tf.float32)
+            batch_loss = loss(labels, logits)
+            scaled_loss = optimizer.get_scaled_loss(batch_loss) if loss_scale else batch_loss
+        grads = tape.gradient(scaled_loss, variables)
+        if loss_scale:
+            grads = optimizer.get_unscaled_gradients(grads)
+        grads = [tf.zeros_like(v) if g is None else g for g, v in zip(grads, variables)]
+        if accumulators is None:
+            optimizer.apply_gradients(zip(grads, variables))
+        else:
+            for acc, g in zip(accumulators, grads):
+                acc.assign_add(tf.convert_to_tensor(g) / accumulate_steps)
+        return batch_loss, logits
+
+    @tf.function
+    def apply_accumulated(scale):
+        optimizer.apply_gradients(zip([acc * scale for acc in accumulators], variables))
+        for acc in accumulators:
+            acc.assign(tf.zeros_like(acc))
+
+    micro_steps = [0]
+    def fit_step(features, labels):
+        out = grad_step(features, labels)
+        if accumulators is not None:
+            micro_steps[0] += 1
+            if micro_steps[0] == accumulate_steps:
+                apply_accumulated(tf.constant(1.0))
+                micro_steps[0] = 0
+        return out
+
+    def flush():
+        """Apply the gradients of a partial accumulation and start the next one from zero."""
+        if accumulators is not None and micro_steps[0]:
+            apply_accumulated(tf.constant(accumulate_steps / micro_steps[0]))
+            micro_steps[0] = 0
+    fit_step.flush = flush
+    return fit_step
+
+def recompute_transformer_blocks(model):
+    """Recompute each GPT-2 block's activations during backprop instead of keeping them alive.
+
+    Activation memory drops to roughly one block's worth at the cost of a second forward
+    pass per block. Dropout is off inside the blocks (embedding and head dropout still apply):
+    a recomputed pass would draw fresh masks, and the gradients would no longer belong to the
+    loss that was computed.
+    """
+    for block in model.transformer.h:
+        def call(x, *args, _base_call=block.call, **kwargs):
+            rest = []
+            def forward(h):
+                outputs = _base_call(h, *args, **{**kwargs, "training": False})
+                rest[:] = outputs[1:]
+                return outputs[0]
+            return [tf.recompute_grad(forward)(x)] + rest
+        block.call = call
+
+def make_eval_step(model):
+    @tf.function
+    def eval_step(features, labels):
+        logits = model(features, training=False).logits
+        return loss(labels, logits), logits
+    return eval_step
+
+def run_epoch(ds, step, telemetry=None):
+    losses, correct, count = [], 0, 0
+    for features, labels in (telemetry.iterate(ds) if telemetry else ds):
+        with telemetry.step(int(tf.size(labels))) if telemetry else nullcontext():
+            batch_loss, logits = step(features, labels)
+            losses.append(float(batch_loss))
+        correct += int(tf.reduce_sum(tf.cast(tf.argmax(logits, -1, output_type=tf.int32) == labels, tf.int32)))
+        count += int(tf.size(labels))
+    return float(np.mean(losses)), correct / count, len(losses)
+
+def fit_classifier(train_ds, val_ds, fit_step, eval_step, epochs=3, telemetry=None):
+    """Train with fit-style epoch logs and return the training throughput in steps/sec."""
+    telemetry = telemetry or TrainingTelemetry("gpt2_classifier")
+    steps, elapsed = 0, 0.0
+    for epoch in range(epochs):
+        start = time.perf_counter()
+        trn_loss, trn_acc, n = run_epoch(train_ds, fit_step, telemetry)
+        fit_step.flush()
+        elapsed += time.perf_counter() - start
+        steps += n
+        val_loss, val_acc, _ = run_epoch(val_ds, eval_step)
+        print(f"Epoch {epoch + 1}/{epochs} - loss: {trn_loss:.4f} - accuracy: {trn_acc:.4f} - val_loss: {val_loss:.4f} - val_accuracy: {val_acc:.4f}")
+    telemetry.report()
+    return steps / elapsed
+
+def training_memory_mb(model, trained):
+    """Weights of `model` plus Adam's two moment slots for each trained variable, in MB (float32)."""
+    trained_refs = {v.ref() for v in trained}
+    frozen = sum(v.shape.num_elements() for v in model.variables if v.ref() not in trained_refs)
+    return (frozen + 3 * sum(v.shape.num_elements() for v in trained)) * 4 / 1e6
+
+# --------------------------- Batched inference ---------------------------
+class SentimentClassifier:
+    """Classify many texts per forward pass: bulk tokenize, sort by length, run compiled batches."""
+    def __init__(self, model, tokenizer, batch_size=32, max_length=64, bucket_width=4,
+                 labels=("Negative 😠", "Positive 😀")):
+        self.tokenizer, self.batch_size, self.max_length = tokenizer, batch_size, max_length
+        self.bucket_width, self.labels = bucket_width, labels
+        self._forward = tf.function(lambda features: tf.nn.softmax(model(features, training=False).logits, axis=-1))
+
+    def classify(self, texts):
+        """Return a (label, probability) pair per text, in input order."""
+        texts = list(texts)
+        ids = self.tokenizer(texts, truncation=True, max_length=self.max_length)["input_ids"]
+        order = np.argsort([len(x) for x in ids], kind="stable")
+        results = [None] * len(texts)
+        for start in range(0, len(texts), self.batch_size):
+            idx = order[start:start + self.batch_size]
+            # Round the width up to the bucket width so only a few shapes get traced.
+            width = -(-max(len(ids[i]) for i in idx) // self.bucket_width) * self.bucket_width
+            input_ids = np.full((len(idx), width), self.tokenizer.pad_token_id, dtype=np.int32)
+            attention_mask = np.zeros((len(idx), width), dtype=np.int32)
+            for row, i in enumerate(idx):
+                input_ids[row, :len(ids[i])] = ids[i]
+                attention_mask[row, :len(ids[i])] = 1
+            probs = self._forward({"input_ids": input_ids, "attention_mask": attention_mask}).numpy()
+            for i, p in zip(idx, probs):
+                results[i] = (self.labels[int(p.argmax())], float(p.max()))
+        return results
+
+    def classify_stream(self, texts, chunk_size=1024):
+        """Classify an iterable of texts lazily, `chunk_size` texts at a time."""
+        texts = iter(texts)
+        for chunk in iter(lambda: list(islice(texts, chunk_size)), []):
+            yield from self.classify(chunk)
+
+class MicroBatcher:
+    """Coalesce concurrent single-text requests into batched `SentimentClassifier` calls.
+
+    A worker thread takes the first waiting request, then keeps collecting requests until
+    it has `max_batch_size` of them or `max_latency` seconds have passed since the first.
+    `close()` answers every request already submitted; submitting afterwards raises RuntimeError.
+    """
+    def __init__(self, classifier, max_batch_size=32, max_latency=0.01):
+        self.classifier, self.max_batch_size, self.max_latency = classifier, max_batch_size, max_latency
+        self._queue = queue.Queue()
+        self._lock, self._closed = threading.Lock(), False
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, text):
+        future = Future()
+        with self._lock:  # so no request lands behind close()'s stop marker
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            self._queue.put((text, future))
+        return future
+
+    def classify(self, text, timeout=None):
+        return self.submit(text).result(timeout)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._worker.join()
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            batch, deadline = [item], time.monotonic() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                results = self.classifier.classify([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+
+# --------------------------- LoRA adapters ---------------------------
+class LoRAAdapters:
+    """Low-rank adapters on the attention and MLP projections of a frozen TF GPT-2 classifier.
+
+    Every targeted TFConv1D projection computes x @ W + (alpha / rank) * x @ A @ B, with B
+    starting at zero so training starts from the base model. Only A, B and the
+    classification head are trained. Loading an adapter assigns new values into the same
+    variables, so one base model serves many tasks and compiled steps keep working.
+    """
+    def __init__(self, model, rank=8, alpha=16, targets=("c_attn", "c_proj", "c_fc")):
+        self.model, self.rank, self.scale = model, rank, alpha / rank
+        self.adapter_variables = []
+        for block in model.transformer.h:
+            for layer in (block.attn.c_attn, block.attn.c_proj, block.mlp.c_fc, block.mlp.c_proj):
+                if layer.name in targets:
+                    self._attach(layer)
+        self._initial = [v.numpy() for v in self.trainable_variables]
+
+    def _attach(self, layer):
+        a = tf.Variable(tf.random.normal([layer.nx, self.rank], stddev=1.0 / self.rank), name=f"{layer.name}_lora_a")
+        b = tf.Variable(tf.zeros([self.rank, layer.nf]), name=f"{layer.name}_lora_b")
+        self.adapter_variables += [a, b]
+        base_call = layer.call
+        layer.call = lambda x: base_call(x) + tf.tensordot(tf.tensordot(x, a, 1), b, 1) * self.scale
+
+    @property
+    def trainable_variables(self):
+        return self.adapter_variables + self.model.score.trainable_variables
+
+    def reset(self):
+        for v, value in zip(self.trainable_variables, self._initial):
+            v.assign(value)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez(path, *[v.numpy() for v in self.trainable_variables])
+
+    def load(self, path):
+        with np.load(path) as f:
+            for i, v in enumerate(self.trainable_variables):
+                v.assign(f[f"arr_{i}"])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab gpt2", description=__doc__)
+    parser.add_argument("--model", default="distilgpt2")
+    parser.add_argument("--epochs", type=int, default=3)
+    args = parser.parse_args(argv)
+    mname = args.model
+
+    tok, model = load_gpt2_classifier(mname)
+    tok.pad_token = tok.eos_token
+    trn_ds = bucketed_batches(tokenize_cached(tok, trn_texts, trn_labels), 2, tok.pad_token_id, shuffle_buffer=6)
+    tst_ds = bucketed_batches(tokenize_cached(tok, tst_texts, tst_labels), 2, tok.pad_token_id)
+    model.config.pad_token_id = tok.eos_token_id
+
+    # Before: every split padded to its longest text. After: length buckets, per-batch padding.
+    padding_report("split-padded", tf.data.Dataset.from_tensor_slices((dict(enc(tok, trn_texts)), trn_labels)).batch(2), model)
+    padding_report("bucketed", trn_ds, model)
+
+    full_steps_per_sec = fit_classifier(trn_ds, tst_ds, make_train_step(model, model.trainable_variables, tf.keras.optimizers.Adam()),
+                                        make_eval_step(model), epochs=args.epochs, telemetry=TrainingTelemetry("gpt2_full"))
+    print("Eval:", list(run_epoch(tst_ds, make_eval_step(model))[:2]))
+    full_memory_mb = training_memory_mb(model, model.trainable_variables)
+
+    # --------------------------- Batched inference ---------------------------
+    classifier = SentimentClassifier(model, tok)
+    def predict(text):
+        return classifier.classify([text])[0][0]
+    for ex in ["The movie was absolutely amazing!","It was dull and disappointing.","The plot was okay, but the acting was weak."]:
+        print(ex,"->",predict(ex))
+
+    reviews = (texts * 64)[:512]
+    classifier.classify(reviews)  # warm up: trace each batch shape once
+    start = time.perf_counter()
+    for r in reviews[:64]:
+        predict(r)
+    print(f"one-at-a-time: {64 / (time.perf_counter() - start):.1f} reviews/s")
+    start = time.perf_counter()
+    classifier.classify(reviews)
+    print(f"batched: {len(reviews) / (time.perf_counter() - start):.1f} reviews/s")
+    batcher = MicroBatcher(classifier, max_batch_size=32, max_latency=0.01)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(batcher.classify, reviews))
+    print(f"micro-batched (32 concurrent callers): {len(reviews) / (time.perf_counter() - start):.1f} reviews/s")
+    batcher.close()
+
+    # --------------------------- LoRA adapters ---------------------------
+    _, lora_model = load_gpt2_classifier(mname)
+    lora_model.config.pad_token_id = tok.eos_token_id
+    adapters = LoRAAdapters(lora_model, rank=8)
+    lora_eval_step = make_eval_step(lora_model)
+    print("\n--- LoRA fine-tuning (sentiment adapter) ---")
+    lora_steps_per_sec = fit_classifier(trn_ds, tst_ds, make_train_step(lora_model, adapters.trainable_variables, tf.keras.optimizers.Adam(1e-3)),
+                                        lora_eval_step, epochs=args.epochs, telemetry=TrainingTelemetry("gpt2_lora_sentiment"))
+    adapters.save("gpt2_adapters/sentiment.npz")
+
+    # A second task on the same base: an adapter trained on flipped labels.
+    print("\n--- LoRA fine-tuning (flipped-label adapter) ---")
+    adapters.reset()
+    flipped_ds = bucketed_batches(tokenize_cached(tok, trn_texts, [1 - l for l in trn_labels]), 2, tok.pad_token_id, shuffle_buffer=6)
+    flipped_tst_ds = bucketed_batches(tokenize_cached(tok, tst_texts, [1 - l for l in tst_labels]), 2, tok.pad_token_id)
+    fit_classifier(flipped_ds, flipped_tst_ds, make_train_step(lora_model, adapters.trainable_variables, tf.keras.optimizers.Adam(1e-3)),
+                   lora_eval_step, epochs=args.epochs, telemetry=TrainingTelemetry("gpt2_lora_flipped"))
+    adapters.save("gpt2_adapters/flipped.npz")
+
+    trained = sum(v.shape.num_elements() for v in adapters.trainable_variables)
+    print(f"\nFull fine-tune: {full_memory_mb:.1f} MB weights+optimizer, {full_steps_per_sec:.2f} steps/s")
+    print(f"LoRA (rank {adapters.rank}): {training_memory_mb(lora_model, adapters.trainable_variables):.1f} MB weights+optimizer, "
+          f"{lora_steps_per_sec:.2f} steps/s, {trained:,} trained params, "
+          f"{os.path.getsize('gpt2_adapters/sentiment.npz') / 1e6:.2f} MB per adapter file")
+
+    # Hot-swap adapters on the one shared base model.
+    lora_classifier = SentimentClassifier(lora_model, tok)
+    for name in ("sentiment", "flipped"):
+        adapters.load(f"gpt2_adapters/{name}.npz")
+        print(name, [label for label, _ in lora_classifier.classify(tst_texts)])
+
+    # --------------------------- Large effective batches ---------------------------
+    # Accumulate 4 micro-batches of 2 per update under mixed precision with recomputed blocks.
+    # bfloat16 suits CPUs and needs no loss scaling; on GPUs use "mixed_float16" with loss_scale=True.
+    print("\n--- Accumulated mixed-precision fine-tuning ---")
+    accumulate_steps, precision = 4, "mixed_bfloat16"
+    tf.keras.mixed_precision.set_global_policy(precision)
+    _, big_model = load_gpt2_classifier(mname)
+    tf.keras.mixed_precision.set_global_policy("float32")
+    big_model.config.pad_token_id = tok.eos_token_id
+    # Recomputed blocks run with dropout off (so the recomputation matches the forward pass):
+    # big_model trains without dropout in any transformer block for the rest of the run.
+    recompute_transformer_blocks(big_model)
+    big_steps_per_sec = fit_classifier(
+        trn_ds, tst_ds,
+        make_train_step(big_model, big_model.trainable_variables, tf.keras.optimizers.Adam(),
+                        accumulate_steps=accumulate_steps, loss_scale=precision == "mixed_float16"),
+        make_eval_step(big_model), epochs=args.epochs, telemetry=TrainingTelemetry("gpt2_accumulated"))
+    print(f"{precision}, accumulate {accumulate_steps}, recompute: {big_steps_per_sec:.2f} micro-steps/s, "
+          f"{big_steps_per_sec * 2:.1f} examples/s, effective batch {2 * accumulate_steps}")
@@ -0,0 +1,398 @@
+"""10) Implement a basic transformer model using PyTorch or TensorFlow and train it on a text dataset like WikiText-2 for language modeling."""
+
+import os
+import time
+import argparse
+import hashlib
+from itertools import chain, islice
+import tensorflow as tf
+from tensorflow.keras import layers
+import numpy as np
+from tokenizers import Tokenizer, decoders, models, pre_tokenizers, trainers
+
+from .telemetry import TrainingTelemetry
+
+texts = [
+    "machine learning is fascinating and powerful",
+    "deep learning is a subset of machine learning",
+    "neural networks can learn complex patterns",
+    "transformers are great for natural language processing",
+    "language models can generate realistic text"
+]
+
+def write_demo_corpus(corpus_path):
+    if not os.path.exists(corpus_path):
+        with open(corpus_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(texts) + "\n")
+
+def bpe_tokenizer_path(text_path, vocab_size):
+    """Where to keep the tokenizer for this corpus and vocabulary size.
+
+    The name carries the vocabulary size and the corpus's size and modification time, so a
+    different --vocab-size or an edited corpus trains a new tokenizer instead of reloading a stale one.
+    """
+    stat = os.stat(text_path)
+    return f"{text_path}.bpe{vocab_size}-{stat.st_size}-{stat.st_mtime_ns}.json"
+
+def train_bpe_tokenizer(text_path, vocab_size=8000, save_path=None):
+    """Train a byte-level BPE tokenizer on a local text file, or reload it from save_path.
+
+    Byte-level BPE has no unknown tokens and a hard cap of `vocab_size` ids; id 0 is <pad>.
+    """
+    if save_path and os.path.exists(save_path):
+        return Tokenizer.from_file(save_path)
+    tokenizer = Tokenizer(models.BPE())
+    tokenizer.pre_tokenizer = pre_tokenizers.ByteLevel(add_prefix_space=True)
+    tokenizer.decoder = decoders.ByteLevel()
+    trainer = trainers.BpeTrainer(vocab_size=vocab_size, special_tokens=["<pad>"],
+                                  initial_alphabet=pre_tokenizers.ByteLevel.alphabet())
+    tokenizer.train([text_path], trainer)
+    if save_path:
+        tokenizer.save(save_path)
+    return tokenizer
+
+def tokenizer_hash(tokenizer):
+    return hashlib.sha256(tokenizer.to_str().encode("utf-8")).hexdigest()[:16]
+
+def encode_corpus_file(text_path, tokenizer, chunk_lines=10000):
+    """Tokenize a text file once into a flat int32 token file and return its path.
+
+    The file is named after the tokenizer hash, so retraining the tokenizer re-encodes
+    while reruns with the same tokenizer reuse the cached ids.
+    """
+    token_path = f"{text_path}.{tokenizer_hash(tokenizer)}.ids"
+    if os.path.exists(token_path) and os.path.getmtime(token_path) >= os.path.getmtime(text_path):
+        return token_path
+    tmp_path = token_path + ".tmp"
+    start = time.perf_counter()
+    with open(text_path, encoding="utf-8") as src, open(tmp_path, "wb") as dst:
+        for lines in iter(lambda: list(islice(src, chunk_lines)), []):
+            ids = chain.from_iterable(e.ids for e in tokenizer.encode_batch(lines))
+            np.fromiter(ids, dtype=np.int32).tofile(dst)
+    os.replace(tmp_path, token_path)
+    mb = os.path.getsize(text_path) / 1e6
+    elapsed = time.perf_counter() - start
+    print(f"Tokenized {mb:.2f} MB in {elapsed:.2f}s ({mb / elapsed:.2f} MB/s) -> {token_path}")
+    return token_path
+
+def sliding_window_dataset(token_path, seq_len, batch_size, stride=None, shuffle_buffer=10000, seed=None):
+    """Stream (input, target) windows of `seq_len` tokens out of a memory-mapped token file.
+
+    Window starts are laid out every `stride` tokens and jittered by a random offset in
+    [0, stride) each epoch (narrowed for the last window so it stays inside the file), so
+    successive epochs see different token alignments. Only window indices are shuffled and
+    whole batches are gathered straight from the memmap, so memory use depends on the batch
+    and shuffle buffer, not on the corpus size.
+    """
+    tokens = np.memmap(token_path, dtype=np.int32, mode="r")
+    stride = stride or seq_len
+    last_start = len(tokens) - seq_len - 1
+    if last_start < 0:
+        raise ValueError(f"{token_path} has {len(tokens)} tokens, need at least {seq_len + 1}")
+    num_windows = last_start // stride + 1
+    offsets = np.arange(seq_len + 1)
+
+    def gather(starts):
+        window = tokens[starts[:, None] + offsets]
+        return window[:, :-1], window[:, 1:]
+
+    def load(idx):
+        base = idx * stride
+        # Uniform over the starts this window can actually take, instead of clamping overflow onto last_start.
+        span = tf.minimum(tf.constant(stride, tf.int64), last_start - base + 1)
+        jitter = tf.random.uniform(tf.shape(idx), dtype=tf.float64, seed=seed) * tf.cast(span, tf.float64)
+        starts = base + tf.cast(jitter, tf.int64)
+        x, y = tf.numpy_function(gather, [starts], (tf.int32, tf.int32))
+        x.set_shape([None, seq_len]); y.set_shape([None, seq_len])
+        return x, y
+
+    return (tf.data.Dataset.range(num_windows)
+            .shuffle(min(num_windows, shuffle_buffer), seed=seed, reshuffle_each_iteration=True)
+            .batch(batch_size)
+            .map(load, num_parallel_calls=tf.data.AUTOTUNE)
+            .prefetch(tf.data.AUTOTUNE))
+
+def _shift_blocks(x, offset):
+    """Shift key/value blocks so block ``i`` lines up with query block ``i + offset``."""
+    n = tf.shape(x)[2]
+    shifted = tf.pad(x[:, :, :n - offset], [[0, 0], [0, 0], [offset, 0], [0, 0], [0, 0]])
+    shifted.set_shape(x.shape)
+    return shifted
+
+def _unshift_blocks(x, offset):
+    """Inverse of ``_shift_blocks``: route per-query-block gradients back to their key block."""
+    unshifted = tf.pad(x[:, :, offset:], [[0, 0], [0, 0], [0, offset], [0, 0], [0, 0]])
+    unshifted.set_shape(x.shape)
+    return unshifted
+
+def _offset_mask(offset, num_blocks, block_size, window):
+    """Valid (query, key) pairs between query block ``i`` and key block ``i - offset``."""
+    idx = tf.range(block_size)
+    rel = offset * block_size + idx[:, None] - idx[None, :]
+    valid = rel >= 0
+    if window is not None:
+        valid &= rel < window
+    return (tf.range(num_blocks)[:, None, None] >= offset) & valid[None]
+
+def blockwise_causal_attention(q, k, v, block_size=128, window=None):
+    """Causal softmax attention over [batch, heads, seq, dim] tensors, one block offset at a time.
+
+    Keys/values are streamed past all query blocks at once with a running max and
+    normaliser (flash-attention style online softmax), so the largest live tensor is
+    [batch, heads, seq, block_size] rather than [batch, heads, seq, seq]. The backward pass
+    recomputes the block scores instead of storing them, keeping training memory linear
+    in sequence length too. ``window`` restricts each query to the previous ``window``
+    positions, which also makes compute linear.
+    """
+    seq_len = q.shape[2] or tf.shape(q)[2]
+    dim = q.shape[-1]
+    scale = 1.0 / float(dim) ** 0.5
+    num_blocks = (seq_len + block_size - 1) // block_size
+    pad = num_blocks * block_size - seq_len
+    num_offsets = num_blocks
+    if window is not None:
+        num_offsets = tf.minimum(num_blocks, (window + block_size - 2) // block_size + 1)
+
+    def to_blocks(t):
+        t = tf.pad(t, [[0, 0], [0, 0], [0, pad], [0, 0]])
+        return tf.reshape(t, tf.concat([tf.shape(t)[:2], [num_blocks, block_size, dim]], 0))
+
+    def scores(qb, kb, offset):
+        s = tf.einsum("bhnqd,bhnkd->bhnqk", qb, _shift_blocks(kb, offset)) * scale
+        mask = _offset_mask(offset, num_blocks, block_size, window)
+        return s, mask
+
+    @tf.custom_gradient
+    def attend(qb, kb, vb):
+        stat_shape = tf.shape(qb)[:-1]
+        def body(offset, m, l, acc):
+            s, mask = scores(qb, kb, offset)
+            s = tf.where(mask, s, -1e30)
+            m_new = tf.maximum(m, tf.reduce_max(s, axis=-1))
+            p = tf.where(mask, tf.exp(s - m_new[..., None]), 0.0)
+            corr = tf.exp(m - m_new)
+            l = l * corr + tf.reduce_sum(p, axis=-1)
+            acc = acc * corr[..., None] + tf.einsum("bhnqk,bhnkd->bhnqd", p, _shift_blocks(vb, offset))
+            return offset + 1, m_new, l, acc
+        _, m, l, acc = tf.while_loop(
+            lambda offset, *_: offset < num_offsets, body,
+            (tf.constant(0), tf.fill(stat_shape, -1e30), tf.zeros(stat_shape), tf.zeros_like(qb)))
+        out = acc / l[..., None]
+        lse = m + tf.math.log(l)
+
+        def grad(d_out):
+            delta = tf.reduce_sum(d_out * out, axis=-1, keepdims=True)
+            def body(offset, dq, dk, dv):
+                s, mask = scores(qb, kb, offset)
+                p = tf.where(mask, tf.exp(s - lse[..., None]), 0.0)
+                dp = tf.einsum("bhnqd,bhnkd->bhnqk", d_out, _shift_blocks(vb, offset))
+                ds = p * (dp - delta) * scale
+                dq += tf.einsum("bhnqk,bhnkd->bhnqd", ds, _shift_blocks(kb, offset))
+                dk += _unshift_blocks(tf.einsum("bhnqk,bhnqd->bhnkd", ds, qb), offset)
+                dv += _unshift_blocks(tf.einsum("bhnqk,bhnqd->bhnkd", p, d_out), offset)
+                return offset + 1, dq, dk, dv
+            _, dq, dk, dv = tf.while_loop(
+                lambda offset, *_: offset < num_offsets, body,
+                (tf.constant(0), tf.zeros_like(qb), tf.zeros_like(kb), tf.zeros_like(vb)))
+            return dq, dk, dv
+
+        return out, grad
+
+    out = attend(to_blocks(q), to_blocks(k), to_blocks(v))
+    out = tf.reshape(out, tf.concat([tf.shape(q)[:2], [num_blocks * block_size, dim]], 0))
+    return out[:, :, :seq_len]
+
+class CausalSelfAttention(layers.Layer):
+    """Multi-head causal self-attention backed by `blockwise_causal_attention`."""
+    def __init__(self, num_heads, key_dim, block_size=128, window=None, **kwargs):
+        super().__init__(**kwargs)
+        self.num_heads, self.key_dim = num_heads, key_dim
+        self.block_size, self.window = block_size, window
+
+    def build(self, input_shape):
+        self.qkv = layers.Dense(3 * self.num_heads * self.key_dim)
+        self.proj = layers.Dense(input_shape[-1])
+
+    def call(self, x):
+        batch, seq_len = tf.shape(x)[0], tf.shape(x)[1]
+        qkv = tf.reshape(self.qkv(x), [batch, seq_len, 3, self.num_heads, self.key_dim])
+        q, k, v = tf.unstack(tf.transpose(qkv, [2, 0, 3, 1, 4]))
+        out = blockwise_causal_attention(q, k, v, self.block_size, self.window)
+        out = tf.reshape(tf.transpose(out, [0, 2, 1, 3]), [batch, seq_len, self.num_heads * self.key_dim])
+        return self.proj(out)
+
+class PositionalEmbedding(layers.Layer):
+    def __init__(self, vocab_size, max_len, embed_dim):
+        super().__init__()
+        self.token_emb = layers.Embedding(vocab_size, embed_dim)
+        self.pos_emb = layers.Embedding(max_len, embed_dim)
+
+    def call(self, x):
+        positions = tf.range(tf.shape(x)[-1])
+        return self.token_emb(x) + self.pos_emb(positions)
+
+def transformer_block(x, embed_dim, num_heads, ff_dim, dropout=0.1, causal=False, block_size=128, window=None):
+    if causal:
+        attn = CausalSelfAttention(num_heads, embed_dim, block_size, window)(x)
+    else:
+        attn = layers.MultiHeadAttention(num_heads=num_heads, key_dim=embed_dim)(x, x)
+    attn = layers.Dropout(dropout)(attn)
+    x = layers.LayerNormalization(epsilon=1e-6)(x + attn)
+    ffn = layers.Dense(ff_dim, activation="relu")(x)
+    ffn = layers.Dense(embed_dim)(ffn)
+    return layers.LayerNormalization(epsilon=1e-6)(x + ffn)
+
+# seq_length=None builds a model that accepts any context up to max_len tokens.
+def build_transformer_lm(vocab_size, seq_length, embed_dim=64, num_heads=2, ff_dim=128, num_layers=2,
+                         max_len=None, causal=True, block_size=128, window=None):
+    inputs = layers.Input(shape=(seq_length,))
+    x = PositionalEmbedding(vocab_size, max_len or seq_length, embed_dim)(inputs)
+    for _ in range(num_layers):
+        x = transformer_block(x, embed_dim, num_heads, ff_dim, causal=causal, block_size=block_size, window=window)
+    outputs = layers.Dense(vocab_size, activation="softmax")(x)
+    return tf.keras.Model(inputs, outputs)
+
+# --------------------------- Batched decoding ---------------------------
+# Prompts are stored ragged: right-padded in one id buffer with a per-sequence length.
+# Each step feeds every sequence its own last `window` tokens, so with causal attention
+# the padding never influences the logits and no attention mask is needed.
+def _filter_logits(logits, top_k=0, top_p=1.0):
+    if top_k:
+        kth = tf.math.top_k(logits, top_k).values[:, -1:]
+        logits = tf.where(logits < kth, -1e9, logits)
+    if top_p < 1.0:
+        sorted_logits = tf.sort(logits, direction="DESCENDING")
+        mass_before = tf.cumsum(tf.nn.softmax(sorted_logits), axis=-1, exclusive=True)
+        cutoff = tf.reduce_min(tf.where(mass_before < top_p, sorted_logits, 1e9), axis=-1, keepdims=True)
+        logits = tf.where(logits < cutoff, -1e9, logits)
+    return logits
+
+def _next_token_logits(model, ids, lens, window):
+    start = tf.maximum(lens - window, 0)
+    context = tf.gather(ids, start[:, None] + tf.range(window), batch_dims=1)
+    probs = tf.gather(model(context, training=False), lens - 1 - start, batch_dims=1)
+    return tf.math.log(probs + 1e-9)
+
+def _append(ids, lens, done, tokens, stop_ids):
+    tokens = tf.where(done, 0, tokens)
+    ids = tf.tensor_scatter_nd_update(ids, tf.stack([tf.range(tf.shape(ids)[0]), lens], 1), tokens)
+    lens += tf.cast(~done, tf.int32)
+    if stop_ids:
+        done |= tf.reduce_any(tokens[:, None] == tf.constant(stop_ids, tf.int32), axis=-1)
+    return ids, lens, done
+
+@tf.function(reduce_retracing=True)
+def _sample_loop(model, ids, lens, max_new_tokens, window, greedy, temperature, top_k, top_p, stop_ids, seed):
+    def step(i, ids, lens, done):
+        logits = _next_token_logits(model, ids, lens, window)
+        if greedy:
+            tokens = tf.argmax(logits, axis=-1, output_type=tf.int32)
+        else:
+            logits = _filter_logits(logits / temperature, top_k, top_p)
+            tokens = tf.random.stateless_categorical(logits, 1, seed=[seed, i], dtype=tf.int32)[:, 0]
+        return (i + 1, *_append(ids, lens, done, tokens, stop_ids))
+    done = tf.zeros_like(lens, dtype=tf.bool)
+    _, ids, lens, _ = tf.while_loop(
+        lambda i, ids, lens, done: (i < max_new_tokens) & ~tf.reduce_all(done), step, (0, ids, lens, done))
+    return ids, lens
+
+@tf.function(reduce_retracing=True)
+def _beam_loop(model, ids, lens, max_new_tokens, window, num_beams, stop_ids):
+    batch = tf.shape(ids)[0] // num_beams
+    scores = tf.tile(tf.concat([[0.0], tf.fill([num_beams - 1], -1e9)], 0)[None], [batch, 1])
+    def step(i, ids, lens, done, scores):
+        logp = _next_token_logits(model, ids, lens, window)
+        vocab = tf.shape(logp)[-1]
+        # A finished beam can only be extended by padding, at no cost.
+        logp = tf.where(done[:, None], tf.one_hot(0, vocab, on_value=0.0, off_value=-1e9)[None], logp)
+        total = scores[:, :, None] + tf.reshape(logp, [batch, num_beams, vocab])
+        top = tf.math.top_k(tf.reshape(total, [batch, num_beams * vocab]), num_beams)
+        source = tf.reshape(tf.range(batch)[:, None] * num_beams + top.indices // vocab, [-1])
+        ids, lens, done = tf.gather(ids, source), tf.gather(lens, source), tf.gather(done, source)
+        ids, lens, done = _append(ids, lens, done, tf.reshape(top.indices % vocab, [-1]), stop_ids)
+        return i + 1, ids, lens, done, top.values
+    done = tf.zeros_like(lens, dtype=tf.bool)
+    _, ids, lens, _, _ = tf.while_loop(
+        lambda i, ids, lens, done, scores: (i < max_new_tokens) & ~tf.reduce_all(done),
+        step, (0, ids, lens, done, scores))
+    # top_k keeps beams sorted, so beam 0 of every prompt is its best hypothesis.
+    return ids[::num_beams], lens[::num_beams]
+
+def generate_batch(model, tokenizer, prompts, max_new_tokens=20, strategy="greedy", temperature=1.0,
+                   top_k=0, top_p=1.0, num_beams=4, stop_tokens=(), seed=0):
+    """Decode many prompts at once with "greedy", "sample" (temperature/top-k/top-p) or "beam" search.
+
+    Decoding runs in one compiled loop per call; a sequence stops growing once it emits
+    any of `stop_tokens`, and the loop exits when every sequence has stopped.
+    """
+    prompt_ids = [e.ids or [0] for e in tokenizer.encode_batch(list(prompts))]
+    lens = np.array([len(p) for p in prompt_ids], dtype=np.int32)
+    window = model.input_shape[1] or int(lens.max()) + max_new_tokens
+    ids = np.zeros((len(prompt_ids), max(int(lens.max()) + max_new_tokens, window) + 1), dtype=np.int32)
+    for row, p in zip(ids, prompt_ids):
+        row[:len(p)] = p
+    stop_ids = tuple(tokenizer.token_to_id(t) for t in stop_tokens)
+    if strategy == "beam":
+        ids, lens = np.repeat(ids, num_beams, axis=0), np.repeat(lens, num_beams)
+        ids, lens = _beam_loop(model, ids, lens, max_new_tokens, window, num_beams, stop_ids)
+    elif strategy in ("greedy", "sample"):
+        ids, lens = _sample_loop(model, ids, lens, max_new_tokens, window, strategy == "greedy",
+                                 float(temperature), top_k, float(top_p), stop_ids, seed)
+    else:
+        raise ValueError(f"Unknown decoding strategy: {strategy}")
+    return tokenizer.decode_batch([row[:n].tolist() for row, n in zip(ids.numpy(), lens.numpy())])
+
+def generate_text(model, tokenizer, seed_text, num_words=10):
+    return generate_batch(model, tokenizer, [seed_text], max_new_tokens=num_words)[0]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab lm", description=__doc__)
+    # Point --corpus at a larger local file (e.g. WikiText-2's wiki.train.tokens) for real runs.
+    parser.add_argument("--corpus", default="lm_corpus.txt")
+    parser.add_argument("--vocab-size", type=int, default=8000)
+    parser.add_argument("--seq-len", type=int, default=16)
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument("--long-len", type=int, default=2048, help="context of the long-context demo (0 to skip)")
+    args = parser.parse_args(argv)
+
+    corpus_path = args.corpus
+    write_demo_corpus(corpus_path)
+    tokenizer = train_bpe_tokenizer(corpus_path, vocab_size=args.vocab_size, save_path=bpe_tokenizer_path(corpus_path, args.vocab_size))
+    vocab_size = tokenizer.get_vocab_size()
+    token_path = encode_corpus_file(corpus_path, tokenizer)
+    token_file = np.memmap(token_path, dtype=np.int32, mode="r")
+
+    seq_len = args.seq_len
+    train_ds = sliding_window_dataset(token_path, seq_len, batch_size=16, stride=1)
+
+    model = build_transformer_lm(vocab_size, seq_len)
+    model.compile(optimizer="adam", loss="sparse_categorical_crossentropy", metrics=["accuracy"])
+    model.summary()
+    telemetry = TrainingTelemetry("transformer_lm")
+    model.fit(train_ds, epochs=args.epochs, verbose=1, callbacks=[telemetry.callback(16)])
+    telemetry.report()
+
+    print("\n--- Text Generation ---")
+    print(generate_text(model, tokenizer, "machine learning is", num_words=25))
+
+    # Each prompt stops at the end of its own line ("Ċ" is the byte-level newline token).
+    prompts = ["machine learning is", "neural networks", "language models can", "deep"]
+    print("\n--- Batched Generation ---")
+    for strategy, kwargs in [("greedy", {}), ("sample", {"temperature": 0.8, "top_k": 20, "top_p": 0.9}), ("beam", {"num_beams": 4})]:
+        start = time.perf_counter()
+        outputs = generate_batch(model, tokenizer, prompts, max_new_tokens=20, strategy=strategy,
+                                 stop_tokens=("Ċ",), **kwargs)
+        print(f"{strategy}: {len(prompts)} prompts in {time.perf_counter() - start:.2f}s")
+        for prompt, out in zip(prompts, outputs):
+            print(f"  {prompt!r} -> {out!r}")
+
+    if not args.long_len:
+        return
+
+    # Long contexts: blockwise causal attention keeps memory linear in sequence length,
+    # so the same architecture trains on multi-thousand-token windows on CPU.
+    long_len = args.long_len
+    long_model = build_transformer_lm(vocab_size, None, max_len=long_len, block_size=128, window=512)
+    long_model.compile(optimizer="adam", loss="sparse_categorical_crossentropy")
+    long_ids = np.resize(token_file, (2, long_len + 1))
+    long_model.fit(long_ids[:, :-1], long_ids[:, 1:], epochs=1, verbose=1)
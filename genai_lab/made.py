@@ -0,0 +1,99 @@
+"""6) Implement MADE and train it on a dataset like MNIST for image generation."""
+
+import argparse
+
+import tensorflow as tf
+import tensorflow_probability as tfp
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .telemetry import TrainingTelemetry
+from .checkpoint import TrainingCheckpoint, add_checkpoint_args, run_config
+
+# ---------------- Data ----------------
+def load_binarized_mnist(train_size=5000, test_size=500):
+    (x_train, _), _ = tf.keras.datasets.mnist.load_data()
+    x_train = ((x_train/255.0) > 0.5).astype(np.float32).reshape(-1, 28*28)
+    return x_train[:train_size]
+
+def visualize_samples(samples, title="Samples"):
+    samples = samples.reshape(-1,28,28)
+    plt.figure(figsize=(10,2))
+    for i in range(min(8,samples.shape[0])):
+        plt.subplot(1,min(8,samples.shape[0]),i+1)
+        plt.imshow(samples[i],cmap="binary"); plt.axis("off")
+    plt.suptitle(title); plt.show()
+
+# ---------------- MADE ----------------
+class MADE(tf.keras.Model):
+    def __init__(self, D, H, seed=None):
+        super().__init__()
+        self.D, self.H = D,H
+        rng = np.random.RandomState(seed)
+        self.deg_input = np.arange(1,D+1)
+        self.deg_hidden = rng.randint(1,D,size=H)
+        self.deg_output = np.arange(1,D+1)
+
+        self.W_in_hid = self.add_weight(name="W_in_hid", shape=(D,H),
+                                        initializer="glorot_uniform")
+        self.b_hid = self.add_weight(name="b_hid", shape=(H,), initializer="zeros")
+        self.W_hid_out = self.add_weight(name="W_hid_out", shape=(H,D),
+                                         initializer="glorot_uniform")
+        self.b_out = self.add_weight(name="b_out", shape=(D,), initializer="zeros")
+
+        self.mask_in_hid = (self.deg_input[:,None]<=self.deg_hidden[None,:]).astype(np.float32)
+        self.mask_hid_out = (self.deg_hidden[:,None]<self.deg_output[None,:]).astype(np.float32)
+
+    def call(self,x):
+        h = tf.nn.relu(tf.matmul(x,self.W_in_hid*self.mask_in_hid)+self.b_hid)
+        out = tf.matmul(h,self.W_hid_out*self.mask_hid_out)+self.b_out
+        return tf.nn.sigmoid(out)
+
+    def compute_loss(self,x):
+        return tf.reduce_mean(tf.keras.losses.binary_crossentropy(x,self(x)))
+
+    def sample(self,n):
+        x = np.zeros((n,self.D),np.float32)
+        for i in range(self.D):
+            probs = self(x)[:,i]
+            x[:,i] = tfp.distributions.Bernoulli(probs=probs).sample().numpy()
+        return x
+
+# ---------------- Training ----------------
+def train_model(model,x_train,epochs=3,batch_size=128,lr=1e-3,telemetry=None,checkpoint=None):
+    telemetry = telemetry or TrainingTelemetry("made")
+    checkpoint = checkpoint or TrainingCheckpoint("made", directory=None)
+    opt = tf.keras.optimizers.Adam(lr)
+    checkpoint.track(model=model, optimizer=opt)
+    checkpoint.restore(epochs=epochs)
+    ds = tf.data.Dataset.from_tensor_slices(x_train).shuffle(10000).batch(batch_size)
+    for e in range(checkpoint.epoch, epochs):
+        losses = []
+        for batch in telemetry.iterate(ds):
+            with telemetry.step(len(batch)):
+                with tf.GradientTape() as tape:
+                    loss = model.compute_loss(batch)
+                grads = tape.gradient(loss, model.trainable_variables)
+                opt.apply_gradients(zip(grads, model.trainable_variables))
+                losses.append(loss.numpy())
+            checkpoint.end_step()
+        print(f"Epoch {e+1}/{epochs} - loss: {np.mean(losses):.4f}")
+        checkpoint.end_epoch()
+    checkpoint.close()
+    telemetry.report()
+    checkpoint.report()
+
+# ---------------- Main ----------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab made", description=__doc__)
+    parser.add_argument("--epochs", type=int, default=2000)
+    add_checkpoint_args(parser, every=50, unit="epochs")
+    args = parser.parse_args(argv)
+
+    tf.random.set_seed(0); np.random.seed(0)
+    x_train = load_binarized_mnist(train_size=2000)
+    made = MADE(D=28*28,H=400,seed=2)
+    checkpoint = TrainingCheckpoint("made", args.checkpoint_dir, every_epochs=args.checkpoint_every,
+                                    config=run_config(args), fresh=args.fresh)
+    train_model(made,x_train,epochs=args.epochs,batch_size=128,lr=1e-3,checkpoint=checkpoint)
+    visualize_samples(made.sample(8), title="MADE samples")
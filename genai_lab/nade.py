@@ -0,0 +1,126 @@
+"""5) Implement NADE and train it on a dataset like MNIST for image generation."""
+
+import argparse
+
+import numpy as np
+import tensorflow as tf
+import matplotlib.pyplot as plt
+
+from .telemetry import TrainingTelemetry
+from .checkpoint import TrainingCheckpoint, add_checkpoint_args, run_config
+
+# --------------------------- Data Loader ---------------------------
+def load_binarized_mnist(train_size=5000, test_size=500):
+    (x_train, _), (x_test, _) = tf.keras.datasets.mnist.load_data()
+    x_train = (x_train / 255.0).reshape(-1, 28*28)
+    x_test = (x_test / 255.0).reshape(-1, 28*28)
+    x_train = (x_train > 0.5).astype(np.float32)[:train_size]
+    x_test = (x_test > 0.5).astype(np.float32)[:test_size]
+    return x_train, x_test
+
+# --------------------------- NADE Model ---------------------------
+class NADE(tf.keras.Model):
+    def __init__(self, D, H):
+        super().__init__()
+        self.D, self.H = D, H
+        self.W = self.add_weight(name="W", shape=(H, D), initializer="glorot_uniform")
+        self.V = self.add_weight(name="V", shape=(H, D), initializer="glorot_uniform")
+        self.c = self.add_weight(name="c", shape=(H,), initializer="zeros")
+        self.b = self.add_weight(name="b", shape=(D,), initializer="zeros")
+
+    @tf.function
+    def call(self, x):
+        batch_size = tf.shape(x)[0]
+        a = tf.tile(self.c[None, :], [batch_size, 1])
+        outputs = tf.TensorArray(dtype=tf.float32, size=self.D)
+
+        for i in tf.range(self.D):
+            h = tf.nn.sigmoid(a)
+            logit = tf.einsum('bh,h->b', h, self.V[:, i]) + self.b[i]
+            prob = tf.nn.sigmoid(logit)[:, None]
+            outputs = outputs.write(i, prob)
+            a = a + x[:, i:i+1] @ tf.transpose(self.W[:, i:i+1])
+
+        return tf.transpose(outputs.stack(), [1, 0, 2])[:, :, 0]
+
+    @tf.function
+    def compute_loss(self, x):
+        probs = self(x)
+        return tf.reduce_mean(tf.keras.losses.binary_crossentropy(x, probs))
+
+# --------------------------- Training ---------------------------
+def train_model(model, x_train, epochs=30, batch_size=256, lr=2e-3, visualize_every=5, telemetry=None, checkpoint=None):
+    telemetry = telemetry or TrainingTelemetry("nade")
+    checkpoint = checkpoint or TrainingCheckpoint("nade", directory=None)
+    optimizer = tf.keras.optimizers.Adam(learning_rate=lr)
+    checkpoint.track(model=model, optimizer=optimizer)
+    checkpoint.restore(epochs=epochs)
+    dataset = tf.data.Dataset.from_tensor_slices(x_train).shuffle(1000).batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
+    for epoch in range(checkpoint.epoch, epochs):
+        losses = []
+        for step, batch in enumerate(telemetry.iterate(dataset)):
+            with telemetry.step(len(batch)):
+                with tf.GradientTape() as tape:
+                    loss = model.compute_loss(batch)
+                grads = tape.gradient(loss, model.trainable_variables)
+                optimizer.apply_gradients(zip(grads, model.trainable_variables))
+                losses.append(loss.numpy())
+            checkpoint.end_step()
+
+        print(f"Epoch {epoch+1}/{epochs} | Loss: {np.mean(losses):.4f}")
+
+        # Optional visualization every few epochs
+        if (epoch+1) % visualize_every == 0:
+            visualize_samples(model)
+        checkpoint.end_epoch()
+    checkpoint.close()
+    telemetry.report()
+    checkpoint.report()
+
+def visualize_samples(model, num_samples=16):
+    samples = model_sample(model, num_samples)
+    plt.figure(figsize=(4, 4))
+    for i in range(num_samples):
+        plt.subplot(4, 4, i+1)
+        plt.imshow(samples[i].reshape(28, 28), cmap="gray")
+        plt.axis("off")
+    plt.show()
+
+def model_sample(model, num_samples=16):
+    D = model.D
+    x = tf.zeros((num_samples, D), dtype=tf.float32)
+    a = tf.tile(model.c[None, :], [num_samples, 1])
+
+    for i in range(D):
+        h = tf.nn.sigmoid(a)
+        logit = tf.einsum('bh,h->b', h, model.V[:, i]) + model.b[i]
+        prob = tf.nn.sigmoid(logit)
+        xi = tf.cast(tf.random.uniform((num_samples,)) < prob, tf.float32)
+        x = tf.concat([x[:, :i], xi[:, None], x[:, i+1:]], axis=1) # Corrected line
+        a = a + xi[:, None] @ tf.transpose(model.W[:, i:i+1])
+    return x.numpy()
+
+# --------------------------- Main ---------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab nade", description=__doc__)
+    parser.add_argument("--epochs", type=int, default=50)
+    parser.add_argument("--hidden", type=int, default=256)
+    add_checkpoint_args(parser, every=5, unit="epochs")
+    args = parser.parse_args(argv)
+
+    # Force float32 globally
+    tf.keras.mixed_precision.set_global_policy('float32')
+    tf.config.optimizer.set_jit(False)
+
+    x_train, x_test = load_binarized_mnist()
+    D = x_train.shape[1]
+
+    print("\nTraining NADE (Optimized)...")
+    nade = NADE(D=D, H=args.hidden)
+    checkpoint = TrainingCheckpoint("nade", args.checkpoint_dir, every_epochs=args.checkpoint_every,
+                                    config=run_config(args), fresh=args.fresh)
+    train_model(nade, x_train, epochs=args.epochs, batch_size=256, lr=2e-3, visualize_every=5, checkpoint=checkpoint)
+
+    print("Final Sampling...")
+    visualize_samples(nade)
@@ -0,0 +1,196 @@
+"""9) Implement a style transfer algorithm using GANs.
+
+1.   Go to Kaggle and Login your account
+2.   Go to Settings and Create New Token under API section
+3.   Save the downloaded kaggle.json as ~/.kaggle/kaggle.json (chmod 600)
+4.   Run with --download to fetch the dataset `pix2pix-dataset`
+"""
+
+import os
+import argparse
+import subprocess
+import zipfile
+
+import tensorflow as tf
+import matplotlib.pyplot as plt
+
+from .telemetry import TrainingTelemetry
+from .checkpoint import TrainingCheckpoint, add_checkpoint_args, run_config
+
+IMG, BATCH = 256, 4
+DATA_ROOT = '/content'
+images_dir = os.path.join(DATA_ROOT, 'facades/facades/train')
+
+def download_dataset(root=DATA_ROOT):
+    """Fetch and unpack the Kaggle pix2pix dataset (needs the kaggle CLI and ~/.kaggle/kaggle.json)."""
+    subprocess.run(["kaggle", "datasets", "download", "-d", "vikramtiwari/pix2pix-dataset", "-p", root], check=True)
+    with zipfile.ZipFile(os.path.join(root, "pix2pix-dataset.zip")) as z:
+        z.extractall(root)
+
+def split(p):
+    i = tf.image.decode_jpeg(tf.io.read_file(p), 3)
+    w = tf.shape(i)[1] // 2
+    a = tf.image.resize(tf.cast(i[:, w:, :], tf.float32)/255., [IMG, IMG])
+    b = tf.image.resize(tf.cast(i[:, :w, :], tf.float32)/255., [IMG, IMG])
+    return a, b
+
+def load_dataset(images_dir=images_dir, batch_size=BATCH):
+    paths = [os.path.join(images_dir, f) for f in os.listdir(images_dir)]
+    return tf.data.Dataset.from_tensor_slices(paths).map(split).shuffle(512).batch(batch_size).prefetch(tf.data.AUTOTUNE)
+
+# ---------------------------
+# GENERATOR
+# ---------------------------
+def G():
+    i = tf.keras.Input([IMG, IMG, 3])
+    x = tf.keras.layers.Conv2D(32, 4, 2, 'same', activation='relu')(i)
+    s1 = x
+    x = tf.keras.layers.Conv2D(64, 4, 2, 'same', activation='relu')(x)
+    s2 = x
+    x = tf.keras.layers.Conv2D(128, 4, 2, 'same', activation='relu')(x)
+
+    x = tf.keras.layers.UpSampling2D(2)(x)
+    x = tf.keras.layers.Conv2D(64, 3, 1, 'same', activation='relu')(x)
+    x = tf.keras.layers.Concatenate()([x, s2])
+
+    x = tf.keras.layers.UpSampling2D(2)(x)
+    x = tf.keras.layers.Conv2D(32, 3, 1, 'same', activation='relu')(x)
+    x = tf.keras.layers.Concatenate()([x, s1])
+
+    x = tf.keras.layers.UpSampling2D(2)(x)
+    o = tf.keras.layers.Conv2D(3, 3, 1, 'same', activation='tanh')(x)
+    return tf.keras.Model(i, o)
+
+# ---------------------------
+# PATCHGAN DISCRIMINATOR
+# ---------------------------
+def D():
+    inp = tf.keras.Input([IMG, IMG, 3])
+    tar = tf.keras.Input([IMG, IMG, 3])
+
+    x = tf.keras.layers.Concatenate()([inp, tar])
+
+    # PatchGAN: progressively downsample
+    x = tf.keras.layers.Conv2D(64, 4, 2, 'same')(x)
+    x = tf.keras.layers.LeakyReLU(0.2)(x)
+
+    x = tf.keras.layers.Conv2D(128, 4, 2, 'same')(x)
+    x = tf.keras.layers.BatchNormalization()(x)
+    x = tf.keras.layers.LeakyReLU(0.2)(x)
+
+    x = tf.keras.layers.Conv2D(256, 4, 2, 'same')(x)
+    x = tf.keras.layers.BatchNormalization()(x)
+    x = tf.keras.layers.LeakyReLU(0.2)(x)
+
+    x = tf.keras.layers.Conv2D(512, 4, 1, 'same')(x)
+    x = tf.keras.layers.BatchNormalization()(x)
+    x = tf.keras.layers.LeakyReLU(0.2)(x)
+
+    # PatchGAN output — NOT a single scalar, but an N×N map
+    o = tf.keras.layers.Conv2D(1, 4, 1, 'same', activation='sigmoid')(x)
+
+    return tf.keras.Model([inp, tar], o)
+
+# The first, smaller discriminator: three convolutions and no normalization.
+def small_D():
+    a = tf.keras.Input([IMG, IMG, 3])
+    b = tf.keras.Input([IMG, IMG, 3])
+    x = tf.keras.layers.Concatenate()([a, b])
+
+    x = tf.keras.layers.Conv2D(32, 4, 2, 'same')(x)
+    x = tf.keras.layers.LeakyReLU(0.2)(x)
+
+    x = tf.keras.layers.Conv2D(64, 4, 2, 'same')(x)
+    x = tf.keras.layers.LeakyReLU(0.2)(x)
+
+    x = tf.keras.layers.Conv2D(128, 4, 1, 'same')(x)
+    x = tf.keras.layers.LeakyReLU(0.2)(x)
+
+    o = tf.keras.layers.Conv2D(1, 4, 1, 'same', activation='sigmoid')(x)
+
+    return tf.keras.Model([a, b], o)
+
+# ---------------------------
+# LOSSES & TRAINING
+# ---------------------------
+bce = tf.keras.losses.BinaryCrossentropy()
+mae = tf.keras.losses.MeanAbsoluteError()
+
+def make_step(gen, disc, gopt, dopt):
+    @tf.function
+    def step(inp, real, lam=100.0):
+        with tf.GradientTape() as td:
+            fake = gen(inp, training=True)
+            ro = disc([inp, real], training=True)
+            fo = disc([inp, fake], training=True)
+            dl = bce(tf.ones_like(ro), ro) + bce(tf.zeros_like(fo), fo)
+        dopt.apply_gradients(zip(td.gradient(dl, disc.trainable_variables), disc.trainable_variables))
+
+        with tf.GradientTape() as tg:
+            fake = gen(inp, training=True)
+            fo = disc([inp, fake], training=False)
+            gl = bce(tf.ones_like(fo), fo) + lam * mae(real, fake)
+        gopt.apply_gradients(zip(tg.gradient(gl, gen.trainable_variables), gen.trainable_variables))
+        return dl, gl
+    return step
+
+def show_translation(gen, ds):
+    x, y = next(iter(ds))
+    f = gen(x, training=False)
+
+    plt.figure(figsize=(6,3))
+    plt.subplot(1,2,1)
+    plt.imshow(x[0])
+    plt.title('Input')
+    plt.axis('off')
+
+    plt.subplot(1,2,2)
+    plt.imshow(f[0])
+    plt.title('Translated (Fake)')
+    plt.axis('off')
+    plt.show()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab pix2pix", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-root", default=DATA_ROOT)
+    parser.add_argument("--download", action="store_true", help="fetch the dataset from Kaggle first")
+    parser.add_argument("--discriminator", choices=("patchgan", "small"), default="patchgan",
+                        help="the notebook trained small for 5000 steps, then patchgan for 1000")
+    parser.add_argument("--steps", type=int, default=1000)
+    add_checkpoint_args(parser, every=250, unit="steps")
+    args = parser.parse_args(argv)
+
+    if args.download:
+        download_dataset(args.data_root)
+    ds = load_dataset(os.path.join(args.data_root, 'facades/facades/train'))
+
+    gen, disc = G(), (D() if args.discriminator == "patchgan" else small_D())
+    gopt = tf.keras.optimizers.Adam(2e-4, 0.5)
+    dopt = tf.keras.optimizers.Adam(2e-4, 0.5)
+    step = make_step(gen, disc, gopt, dopt)
+    checkpoint = TrainingCheckpoint(f"pix2pix_{args.discriminator}", args.checkpoint_dir, every_steps=args.checkpoint_every,
+                                    every_epochs=None, config=run_config(args, ignore=("download", "data_root")),
+                                    fresh=args.fresh, gen=gen, disc=disc, gopt=gopt, dopt=dopt)
+    checkpoint.restore(steps=args.steps)
+
+    # ---------------------------
+    # TRAIN LOOP
+    # ---------------------------
+    it = iter(ds.repeat())
+    telemetry = TrainingTelemetry(f"pix2pix_{args.discriminator}")
+    log_every = max(1, args.steps // 5)
+    for s, (x, y) in zip(range(checkpoint.step, args.steps), telemetry.iterate(it)):
+        with telemetry.step(x.shape[0]):
+            dl, gl = step(x, y)
+        checkpoint.end_step()
+        if s % log_every == 0:
+            print(f"step {s}: D={dl.numpy():.4f}, G={gl.numpy():.4f}")
+    checkpoint.close()
+    telemetry.report()
+    checkpoint.report()
+
+    # ---------------------------
+    # TEST AND SHOW ONLY INPUT + FAKE
+    # ---------------------------
+    show_translation(gen, ds)
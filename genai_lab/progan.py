@@ -0,0 +1,104 @@
+"""8) Implement Progressive GAN and train it on a dataset like MNIST."""
+
+import argparse
+
+import tensorflow as tf
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .telemetry import TrainingTelemetry
+
+LATENT, BATCH, EPOCHS = 100, 64, 2
+STAGES = [8, 16, 32, 64]
+
+def load_images():
+    (x, _), _ = tf.keras.datasets.mnist.load_data()
+    return (x.astype('float32') / 127.5 - 1)[..., None]
+
+def G(r):
+    m = tf.keras.Sequential([tf.keras.layers.Input((LATENT,)),
+                             tf.keras.layers.Dense(4*4*128),
+                             tf.keras.layers.Reshape((4,4,128))])
+    c, f = 4, 128
+    while c < r:
+        m.add(tf.keras.layers.UpSampling2D())
+        f = max(16, f//2)
+        m.add(tf.keras.layers.Conv2D(f, 3, padding='same'))
+        m.add(tf.keras.layers.LeakyReLU(0.2))
+        c *= 2
+    m.add(tf.keras.layers.Conv2D(1, 3, padding='same', activation='tanh'))
+    return m
+
+def D(r):
+    m = tf.keras.Sequential([tf.keras.layers.Input((r,r,1))])
+    f, c = 32, r
+    while c > 4:
+        m.add(tf.keras.layers.Conv2D(f, 3, padding='same'))
+        m.add(tf.keras.layers.LeakyReLU(0.2))
+        m.add(tf.keras.layers.AveragePooling2D(2))
+        c //= 2
+        f = min(256, f*2)
+    m.add(tf.keras.layers.Flatten())
+    m.add(tf.keras.layers.Dense(1, 'sigmoid'))
+    return m
+
+bce = tf.keras.losses.BinaryCrossentropy()
+
+def train_step(G, D, real, g_opt, d_opt):
+    z = tf.random.normal([real.shape[0], LATENT])
+    with tf.GradientTape() as g_tape, tf.GradientTape() as d_tape:
+        fake = G(z, training=True)
+        r_logit, f_logit = D(real, training=True), D(fake, training=True)
+        g_loss = bce(tf.ones_like(f_logit), f_logit)
+        d_loss = (bce(tf.ones_like(r_logit), r_logit) +
+                  bce(tf.zeros_like(f_logit), f_logit)) / 2
+
+    g_grads = g_tape.gradient(g_loss, G.trainable_variables)
+    d_grads = d_tape.gradient(d_loss, D.trainable_variables)
+
+    g_opt.apply_gradients(zip(g_grads, G.trainable_variables))
+    d_opt.apply_gradients(zip(d_grads, D.trainable_variables))
+
+    return float(g_loss), float(d_loss)
+
+def show_samples(G_model, r):
+    samples = (G_model(tf.random.normal([9, LATENT]), training=False).numpy() + 1) / 2
+    fig, axes = plt.subplots(3, 3, figsize=(4, 4))
+    for img, ax in zip(samples, axes.flat):
+        ax.imshow(img[..., 0], cmap='gray')
+        ax.axis('off')
+    plt.suptitle(f"{r}x{r}")
+    plt.show()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab progan", description=__doc__)
+    parser.add_argument("--epochs", type=int, default=EPOCHS, help="epochs per resolution stage")
+    parser.add_argument("--stages", type=int, nargs="+", default=STAGES)
+    args = parser.parse_args(argv)
+
+    x = load_images()
+    for r in args.stages:
+        print(f"\nTraining {r}x{r}")
+        G_model, D_model = G(r), D(r)
+
+        # Create new optimizers for each stage
+        g_opt = tf.keras.optimizers.Adam(2e-4, 0.5)
+        d_opt = tf.keras.optimizers.Adam(2e-4, 0.5)
+
+        ds = tf.data.Dataset.from_tensor_slices(
+            tf.image.resize(x, [r, r]).numpy()
+        ).shuffle(10000).batch(BATCH)
+
+        telemetry = TrainingTelemetry(f"progan_{r}x{r}")
+        for epoch in range(args.epochs):
+            g_losses, d_losses = [], []
+            for batch in telemetry.iterate(ds.take(100)):
+                with telemetry.step(batch.shape[0]):
+                    g_loss, d_loss = train_step(G_model, D_model, batch, g_opt, d_opt)
+                g_losses.append(g_loss)
+                d_losses.append(d_loss)
+            print(f"Epoch {epoch+1}: G={np.mean(g_losses):.3f} D={np.mean(d_losses):.3f}")
+        telemetry.report()
+
+        # Generate samples
+        show_samples(G_model, r)
@@ -0,0 +1,135 @@
+"""2) Explore different regularization techniques such as L1/L2 regularization or dropout and compare their effects on the autoencoder's performance."""
+
+import argparse
+import functools
+
+import tensorflow as tf
+from tensorflow.keras import layers, models, regularizers, callbacks
+from tensorflow.keras.datasets import mnist
+from tensorflow.keras.preprocessing.image import ImageDataGenerator
+import numpy as np
+
+from .telemetry import TrainingTelemetry
+from .checkpoint import TrainingCheckpoint
+
+@functools.lru_cache(maxsize=1)
+def load_data():
+    # Load and preprocess data
+    (x_train, _), (x_test, _) = mnist.load_data()
+    x_train = x_train.astype('float32') / 255.0
+    x_test = x_test.astype('float32') / 255.0
+    x_train = x_train[..., np.newaxis]
+    x_test = x_test[..., np.newaxis]
+    return x_train, x_test
+
+def build_autoencoder(reg_type=None, reg_rate=0.0, dropout_rate=0.0):
+    input_img = layers.Input((28, 28, 1))
+
+    if reg_type == 'l1':
+        regularizer = regularizers.l1(reg_rate)
+    elif reg_type == 'l2':
+        regularizer = regularizers.l2(reg_rate)
+    elif reg_type == 'l1_l2':
+        regularizer = regularizers.l1_l2(l1=reg_rate, l2=reg_rate)
+    else:
+        regularizer = None
+
+    x = layers.Conv2D(32, 3, activation='relu', padding='same', kernel_regularizer=regularizer)(input_img)
+    if dropout_rate > 0:
+        x = layers.Dropout(dropout_rate)(x)
+    x = layers.MaxPooling2D(2, padding='same')(x)
+
+    x = layers.Conv2D(16, 3, activation='relu', padding='same', kernel_regularizer=regularizer)(x)
+    if dropout_rate > 0:
+        x = layers.Dropout(dropout_rate)(x)
+    encoded = layers.MaxPooling2D(2, padding='same')(x)
+
+    x = layers.Conv2D(16, 3, activation='relu', padding='same')(encoded)
+    x = layers.UpSampling2D(2)(x)
+    x = layers.Conv2D(32, 3, activation='relu', padding='same')(x)
+    x = layers.UpSampling2D(2)(x)
+    decoded = layers.Conv2D(1, 3, activation='sigmoid', padding='same')(x)
+
+    return models.Model(input_img, decoded)
+
+def train_autoencoder(config, data=None, epochs=None, checkpoint=None):
+    """Train one configuration; `epochs` overrides the default schedule and a checkpoint resumes it."""
+    x_train, x_test = data or load_data()
+    model = build_autoencoder(config['reg_type'], config['reg_rate'], config['dropout_rate'])
+    model.compile(optimizer=tf.keras.optimizers.Adam(config['lr']), loss='binary_crossentropy')
+    checkpoint = checkpoint or TrainingCheckpoint("regularization", directory=None)
+    checkpoint.track(model=model, optimizer=model.optimizer)
+    checkpoint.restore()
+    if checkpoint.epoch >= (epochs or (2 if config['data_aug'] else 10)):
+        # Already trained this far (say, the result was lost before it was recorded): just evaluate.
+        train_loss = model.evaluate(x_train, x_train, batch_size=128, verbose=0)
+        val_loss = model.evaluate(x_test, x_test, batch_size=128, verbose=0)
+        checkpoint.close()
+        return round(train_loss, 4), round(val_loss, 4)
+
+    telemetry = TrainingTelemetry("regularization_" + "_".join(f"{k}-{v}" for k, v in config.items()))
+    callbacks_list = [telemetry.callback(128), checkpoint.callback()]
+    if config['early_stop']:
+        callbacks_list.append(callbacks.EarlyStopping(monitor='val_loss', patience=5, restore_best_weights=True))
+
+    if config['data_aug']:
+        datagen = ImageDataGenerator(rotation_range=10, width_shift_range=0.1, height_shift_range=0.1, zoom_range=0.1)
+        train_gen = datagen.flow(x_train, x_train, batch_size=128)
+        history = model.fit(train_gen, steps_per_epoch=len(x_train)//128, epochs=epochs or 2, initial_epoch=checkpoint.epoch, validation_data=(x_test, x_test), callbacks=callbacks_list, verbose=0)
+    else:
+        history = model.fit(x_train, x_train, epochs=epochs or 10, initial_epoch=checkpoint.epoch, batch_size=128, validation_data=(x_test, x_test), callbacks=callbacks_list, verbose=0)
+    checkpoint.close()
+    telemetry.report()
+    checkpoint.report()
+
+    return round(history.history['loss'][-1], 4), round(history.history['val_loss'][-1], 4)
+
+# Experiment configurations
+EXPERIMENTS = [
+    {'reg_type': None, 'reg_rate': 0.0, 'dropout_rate': 0.0, 'lr': 0.001, 'early_stop': False, 'data_aug': False},
+    {'reg_type': 'l1', 'reg_rate': 0.001, 'dropout_rate': 0.0, 'lr': 0.001, 'early_stop': False, 'data_aug': False},
+    {'reg_type': 'l2', 'reg_rate': 0.001, 'dropout_rate': 0.0, 'lr': 0.001, 'early_stop': False, 'data_aug': False},
+    {'reg_type': 'l1_l2', 'reg_rate': 0.001, 'dropout_rate': 0.0, 'lr': 0.001, 'early_stop': False, 'data_aug': False},
+    {'reg_type': None, 'reg_rate': 0.0, 'dropout_rate': 0.3, 'lr': 0.001, 'early_stop': False, 'data_aug': False},
+    {'reg_type': None, 'reg_rate': 0.0, 'dropout_rate': 0.0, 'lr': 0.001, 'early_stop': True, 'data_aug': False},
+    {'reg_type': None, 'reg_rate': 0.0, 'dropout_rate': 0.0, 'lr': 0.001, 'early_stop': False, 'data_aug': True},
+]
+
+def describe(config):
+    if config['reg_type']:
+        return config['reg_type'].upper()
+    elif config['dropout_rate'] > 0:
+        return "Dropout"
+    elif config['early_stop']:
+        return "Early Stopping"
+    elif config['data_aug']:
+        return "Data Augmentation"
+    return "None"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab regularization", description=__doc__)
+    parser.add_argument("--only", type=int, nargs="+", help="1-based experiment numbers to run (default: all)")
+    args = parser.parse_args(argv)
+
+    # Run experiments
+    results = []
+    for i, config in enumerate(EXPERIMENTS, 1):
+        if args.only and i not in args.only:
+            continue
+        print(f"Experiment {i}: {config}")
+        train_loss, val_loss = train_autoencoder(config)
+
+        results.append({
+            'S.no': i,
+            'Regularization': describe(config),
+            'Dropout_rate': config['dropout_rate'],
+            'Regularization_rate': config['reg_rate'],
+            'Learning_rate': config['lr'],
+            'Training_loss': train_loss,
+            'Validation_loss': val_loss
+        })
+
+    # Display results
+    print("\nResults:")
+    for r in results:
+        print(f"{r['S.no']:2d} | {r['Regularization']:15s} | Dropout: {r['Dropout_rate']:<4} | Reg Rate: {r['Regularization_rate']:<6} | LR: {r['Learning_rate']:<6} | Train Loss: {r['Training_loss']:<6} | Val Loss: {r['Validation_loss']:<6}")
@@ -0,0 +1,223 @@
+"""Successive-halving (ASHA) search over the regularization study's autoencoder configurations.
+
+Every trial trains for `min_epochs` first; whenever a worker is free, the best 1/eta of the
+trials that finished a rung are promoted to the next rung (eta times the epochs) and continue
+from their checkpoint, so clearly losing configurations stop after a few epochs. Trials run in a
+process pool with a per-trial thread limit, and every result goes into a SQLite database, so an
+interrupted search resumes where it stopped.
+
+    python -m genai_lab search [--trials 27] [--max-epochs 9] [--eta 3] [--workers 4 --threads 2]
+"""
+
+import os
+import json
+import time
+import random
+import sqlite3
+import hashlib
+import argparse
+import itertools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+SEARCH_DIR = "search_runs"
+
+# The build_autoencoder / train_autoencoder knobs; early stopping is left to the search itself.
+SEARCH_SPACE = {
+    'reg_type': [None, 'l1', 'l2', 'l1_l2'],
+    'reg_rate': [1e-4, 1e-3, 1e-2],
+    'dropout_rate': [0.0, 0.1, 0.3],
+    'lr': [3e-4, 1e-3, 3e-3],
+    'data_aug': [False, True],
+}
+
+def grid(space=SEARCH_SPACE):
+    """Every configuration in `space`, without the duplicates that differ only in an unused reg_rate."""
+    configs, seen = [], set()
+    keys = list(space)
+    for values in itertools.product(*(space[k] for k in keys)):
+        config = dict(zip(keys, values), early_stop=False)
+        if config['reg_type'] is None:
+            config['reg_rate'] = 0.0
+        key = trial_id(config)
+        if key not in seen:
+            seen.add(key)
+            configs.append(config)
+    return configs
+
+def trial_id(config):
+    return hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()[:12]
+
+def rungs(min_epochs=1, max_epochs=9, eta=3):
+    """Epoch budgets min_epochs * eta**k, ending at max_epochs."""
+    budgets = [min_epochs]
+    while budgets[-1] * eta < max_epochs:
+        budgets.append(budgets[-1] * eta)
+    if budgets[-1] != max_epochs:
+        budgets.append(max_epochs)
+    return budgets
+
+class TrialDB:
+    """Trials and their per-rung results, keyed by configuration hash and epoch budget."""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS trials (id TEXT PRIMARY KEY, config TEXT NOT NULL, error TEXT);
+            CREATE TABLE IF NOT EXISTS results (
+                trial_id TEXT NOT NULL, epochs INTEGER NOT NULL, train_loss REAL, val_loss REAL,
+                seconds REAL, finished REAL, PRIMARY KEY (trial_id, epochs));
+        """)
+
+    def add(self, configs):
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO trials (id, config) VALUES (?, ?)",
+                                [(trial_id(c), json.dumps(c)) for c in configs])
+        return [trial_id(c) for c in configs]
+
+    def config(self, tid):
+        return json.loads(self.db.execute("SELECT config FROM trials WHERE id = ?", (tid,)).fetchone()[0])
+
+    def failed(self):
+        return {row[0] for row in self.db.execute("SELECT id FROM trials WHERE error IS NOT NULL")}
+
+    def record(self, tid, epochs, train_loss, val_loss, seconds):
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                            (tid, epochs, train_loss, val_loss, seconds, time.time()))
+
+    def fail(self, tid, error):
+        with self.db:
+            self.db.execute("UPDATE trials SET error = ? WHERE id = ?", (error, tid))
+
+    def results(self, epochs):
+        """{trial id: val_loss} for the trials that finished `epochs` epochs."""
+        return dict(self.db.execute("SELECT trial_id, val_loss FROM results WHERE epochs = ?", (epochs,)))
+
+    def seconds(self, ids):
+        marks = ",".join("?" * len(ids))
+        return self.db.execute(f"SELECT COALESCE(SUM(seconds), 0) FROM results WHERE trial_id IN ({marks})",
+                               ids).fetchone()[0]
+
+def next_job(db, ids, budgets, eta, running):
+    """ASHA: promote the best unpromoted trial of the highest rung that has one, else start a new trial."""
+    busy = {tid for tid, _ in running}
+    requested, failed = set(ids), db.failed()
+    for k in reversed(range(len(budgets) - 1)):
+        done = {tid: loss for tid, loss in db.results(budgets[k]).items() if tid in requested}
+        promoted = db.results(budgets[k + 1])
+        for tid in sorted(done, key=done.get)[:len(done) // eta]:
+            if tid not in promoted and tid not in busy and tid not in failed:
+                return tid, budgets[k + 1]
+    started = set(db.results(budgets[0])) | failed | busy
+    for tid in ids:
+        if tid not in started:
+            return tid, budgets[0]
+    return None
+
+_DATA = None
+
+def _init_worker(threads, train_size):
+    """Pin a worker to `threads` threads and load (a subset of) MNIST once per process."""
+    global _DATA
+    for var in ("OMP_NUM_THREADS", "TF_NUM_INTRAOP_THREADS"):
+        os.environ[var] = str(threads)
+    os.environ["TF_NUM_INTEROP_THREADS"] = "1"
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    from .regularization import load_data
+    x_train, x_test = load_data()
+    _DATA = (x_train[:train_size], x_test[:max(1, train_size // 6)]) if train_size else (x_train, x_test)
+
+def _run_trial(tid, config, epochs, checkpoint_dir, train_size=None):
+    """Train trial `tid` up to `epochs` epochs, continuing from its checkpoint."""
+    from .regularization import train_autoencoder
+    from .checkpoint import TrainingCheckpoint
+    start = time.perf_counter()
+    # Keyed by data size too, so searches on different subsets never resume each other's weights.
+    checkpoint = TrainingCheckpoint(f"{tid}-n{train_size or 'all'}", checkpoint_dir, every_epochs=1, max_to_keep=1)
+    train_loss, val_loss = train_autoencoder(config, data=_DATA, epochs=epochs, checkpoint=checkpoint)
+    return train_loss, val_loss, time.perf_counter() - start
+
+def search(configs, db_path, min_epochs=1, max_epochs=9, eta=3, workers=2, threads=2, train_size=None,
+           checkpoint_dir=None):
+    """Run (or resume) an ASHA search over `configs`; returns the database, trial ids and rung budgets."""
+    budgets = rungs(min_epochs, max_epochs, eta)
+    db = TrialDB(db_path)
+    ids = db.add(configs)
+    checkpoint_dir = checkpoint_dir or os.path.join(os.path.dirname(db_path) or ".", "checkpoints")
+    print(f"{len(ids)} trials, rungs {budgets} epochs, {workers} workers x {threads} threads")
+    # spawn, not fork: the parent may have initialized TensorFlow's thread pools already.
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker, initargs=(threads, train_size)) as pool:
+        running = {}
+        while True:
+            while len(running) < workers:
+                job = next_job(db, ids, budgets, eta, running.values())
+                if job is None:
+                    break
+                tid, epochs = job
+                running[pool.submit(_run_trial, tid, db.config(tid), epochs, checkpoint_dir, train_size)] = job
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                tid, epochs = running.pop(future)
+                try:
+                    train_loss, val_loss, seconds = future.result()
+                except Exception as e:
+                    db.fail(tid, repr(e))
+                    print(f"trial {tid} failed at {epochs} epochs: {e!r}")
+                    continue
+                db.record(tid, epochs, train_loss, val_loss, seconds)
+                print(f"trial {tid} @ {epochs:2d} epochs: val_loss {val_loss:.4f} ({seconds:.0f}s)")
+    return db, ids, budgets
+
+def report(db, ids, budgets, top=5):
+    from .regularization import describe
+    requested, epochs_trained, previous = set(ids), 0, 0
+    for budget in budgets:
+        finished = [tid for tid in db.results(budget) if tid in requested]
+        epochs_trained += len(finished) * (budget - previous)
+        previous = budget
+        print(f"rung {budget:2d} epochs: {len(finished)} trials")
+    for budget in reversed(budgets):
+        results = {tid: loss for tid, loss in db.results(budget).items() if tid in requested}
+        if results:
+            break
+    else:
+        print("No finished trials.")
+        return
+    print(f"\nBest trials after {budget} epochs:")
+    for tid in sorted(results, key=results.get)[:top]:
+        c = db.config(tid)
+        print(f"{tid} | {describe(c):15s} | Reg Rate: {c['reg_rate']:<6} | Dropout: {c['dropout_rate']:<4} | "
+              f"LR: {c['lr']:<6} | Aug: {c['data_aug']!s:5s} | Val Loss: {results[tid]:<6}")
+    print(f"\n{epochs_trained} epochs trained in {db.seconds(ids):.0f} trial-seconds: "
+          f"{epochs_trained / budgets[-1]:.1f}x one {budgets[-1]}-epoch run, "
+          f"vs {len(ids)}x for training every configuration to completion")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab search", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=27, help="configurations sampled from the grid (0: all)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-epochs", type=int, default=1)
+    parser.add_argument("--max-epochs", type=int, default=9)
+    parser.add_argument("--eta", type=int, default=3, help="keep the best 1/eta of each rung")
+    parser.add_argument("--threads", type=int, default=2, help="threads per trial")
+    parser.add_argument("--workers", type=int, help="parallel trials (default: cores // threads)")
+    parser.add_argument("--train-size", type=int, help="train on the first N MNIST images")
+    parser.add_argument("--db", default=os.path.join(SEARCH_DIR, "autoencoder_asha.sqlite"))
+    args = parser.parse_args(argv)
+
+    configs = grid()
+    if args.trials:
+        configs = random.Random(args.seed).sample(configs, min(args.trials, len(configs)))
+    workers = args.workers or max(1, (os.cpu_count() or 1) // args.threads)
+    db, ids, budgets = search(configs, args.db, args.min_epochs, args.max_epochs, args.eta, workers, args.threads,
+                              args.train_size)
+    report(db, ids, budgets)
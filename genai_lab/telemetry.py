@@ -0,0 +1,150 @@
+"""Training telemetry shared by every training loop: step times, throughput, input wait and memory."""
+
+import os
+import json
+import time
+import resource
+from contextlib import contextmanager
+import numpy as np
+import tensorflow as tf
+
+TELEMETRY_DIR = "telemetry"
+# Set by `python -m genai_lab --profile-dir DIR ...`, so every training loop's telemetry profiles.
+PROFILE_DIR_ENV, PROFILE_START_ENV, PROFILE_STEPS_ENV = ("GENAI_LAB_PROFILE_DIR", "GENAI_LAB_PROFILE_START",
+                                                         "GENAI_LAB_PROFILE_STEPS")
+
+class TrainingTelemetry:
+    """Step time histogram, throughput, input-pipeline wait and peak memory for one training run.
+
+    Custom loops iterate with `telemetry.iterate(dataset)` (time spent waiting on the input
+    pipeline) and wrap each update in `with telemetry.step(batch_size):`; Model.fit takes
+    `telemetry.callback(batch_size)`. Steps are timed on the host, so asynchronous device work
+    lands on whichever step waits for it. With `profile_dir` set, a tf.profiler trace covers
+    steps [profile_start, profile_start + profile_steps); all three default to the
+    GENAI_LAB_PROFILE_DIR / _START / _STEPS environment variables, else no profiling, 10 and 20.
+    """
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, name, profile_dir=None, profile_start=None, profile_steps=None):
+        profile_dir = profile_dir or os.environ.get(PROFILE_DIR_ENV)
+        if profile_start is None:
+            profile_start = int(os.environ.get(PROFILE_START_ENV, 10))
+        if profile_steps is None:
+            profile_steps = int(os.environ.get(PROFILE_STEPS_ENV, 20))
+        self.name, self.profile_dir = name, profile_dir
+        self.profile_start, self.profile_stop = profile_start, profile_start + profile_steps
+        self.step_times, self.examples, self.input_wait = [], 0, 0.0
+        self.peak_memory, self.profiling, self.started = 0, False, None
+
+    def iterate(self, iterable):
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self.input_wait += time.perf_counter() - start
+            yield item
+
+    @contextmanager
+    def step(self, batch_size):
+        self.begin_step()
+        start = time.perf_counter()
+        yield
+        self.end_step(time.perf_counter() - start, batch_size)
+
+    def begin_step(self):
+        if self.started is None:
+            self.started = time.perf_counter()
+        if self.profile_dir and len(self.step_times) == self.profile_start:
+            tf.profiler.experimental.start(os.path.join(self.profile_dir, self.name))
+            self.profiling = True
+
+    def end_step(self, seconds, batch_size):
+        self.step_times.append(seconds)
+        self.examples += int(batch_size)
+        self.peak_memory = max(self.peak_memory, self._memory_bytes())
+        if self.profiling and len(self.step_times) >= self.profile_stop:
+            tf.profiler.experimental.stop()
+            self.profiling = False
+
+    @staticmethod
+    def _memory_bytes():
+        if tf.config.list_logical_devices("GPU"):
+            return tf.config.experimental.get_memory_info("GPU:0")["peak"]
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # ru_maxrss is in KiB on Linux
+
+    def callback(self, batch_size):
+        return TelemetryCallback(self, batch_size)
+
+    def summary(self):
+        times = np.array(self.step_times or [0.0])
+        counts = [int((times <= le).sum()) if self.step_times else 0 for le in self.BUCKETS]
+        wall = time.perf_counter() - self.started if self.started else 0.0
+        return {
+            "name": self.name,
+            "steps": len(self.step_times),
+            "examples": self.examples,
+            "wall_s": wall,
+            "examples_per_s": self.examples / wall if wall else 0.0,
+            "step_s": {"mean": float(times.mean()), "p50": float(np.percentile(times, 50)),
+                       "p90": float(np.percentile(times, 90)), "p99": float(np.percentile(times, 99))},
+            "step_histogram": dict(zip(map(str, self.BUCKETS), counts)),
+            "input_wait_s": self.input_wait,
+            "input_wait_fraction": self.input_wait / wall if wall else 0.0,
+            "peak_memory_bytes": int(self.peak_memory),
+        }
+
+    def prometheus(self):
+        """The summary in Prometheus text exposition format."""
+        s, label = self.summary(), f'run="{self.name}"'
+        lines = ["# HELP train_step_seconds Host wall time per training step.",
+                 "# TYPE train_step_seconds histogram"]
+        lines += [f'train_step_seconds_bucket{{{label},le="{le}"}} {n}' for le, n in s["step_histogram"].items()]
+        lines += [f'train_step_seconds_bucket{{{label},le="+Inf"}} {s["steps"]}',
+                  f"train_step_seconds_sum{{{label}}} {sum(self.step_times)}",
+                  f"train_step_seconds_count{{{label}}} {s['steps']}"]
+        for metric, kind, value in (("train_examples_total", "counter", s["examples"]),
+                                    ("train_examples_per_second", "gauge", s["examples_per_s"]),
+                                    ("train_input_wait_seconds_total", "counter", s["input_wait_s"]),
+                                    ("train_peak_memory_bytes", "gauge", s["peak_memory_bytes"])):
+            lines += [f"# TYPE {metric} {kind}", f"{metric}{{{label}}} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def report(self, out_dir=TELEMETRY_DIR):
+        """Print a one-line summary and write <name>.json and <name>.prom under `out_dir`."""
+        if self.profiling:
+            tf.profiler.experimental.stop()
+            self.profiling = False
+        s = self.summary()
+        os.makedirs(out_dir, exist_ok=True)
+        with open(os.path.join(out_dir, f"{self.name}.json"), "w") as f:
+            json.dump(s, f, indent=2)
+        with open(os.path.join(out_dir, f"{self.name}.prom"), "w") as f:
+            f.write(self.prometheus())
+        print(f"[{self.name}] {s['steps']} steps, {s['examples_per_s']:.1f} examples/s, "
+              f"step p50 {1e3 * s['step_s']['p50']:.1f} ms / p99 {1e3 * s['step_s']['p99']:.1f} ms, "
+              f"input wait {100 * s['input_wait_fraction']:.1f}%, peak memory {s['peak_memory_bytes'] / 2**20:.0f} MiB")
+        return s
+
+class TelemetryCallback(tf.keras.callbacks.Callback):
+    """Feeds Model.fit batches into a TrainingTelemetry; the gap between batches counts as input wait."""
+
+    def __init__(self, telemetry, batch_size):
+        super().__init__()
+        self.telemetry, self.batch_size = telemetry, batch_size
+        self.batch_start = self.batch_end = None
+
+    def on_train_batch_begin(self, batch, logs=None):
+        self.batch_start = time.perf_counter()
+        if self.batch_end is not None:
+            self.telemetry.input_wait += self.batch_start - self.batch_end
+        self.telemetry.begin_step()
+
+    def on_train_batch_end(self, batch, logs=None):
+        self.batch_end = time.perf_counter()
+        self.telemetry.end_step(self.batch_end - self.batch_start, self.batch_size)
+
+    def on_epoch_end(self, epoch, logs=None):
+        self.batch_end = None  # validation and epoch bookkeeping are not input wait
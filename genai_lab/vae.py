@@ -0,0 +1,101 @@
+"""3) Implement a variational autoencoder (VAE) and train it on a dataset like MNIST to generate new images."""
+
+import argparse
+
+import numpy as np, tensorflow as tf, keras
+from keras import layers, ops
+import matplotlib.pyplot as plt
+
+from .telemetry import TrainingTelemetry
+from .checkpoint import TrainingCheckpoint, add_checkpoint_args, run_config
+
+class Sampling(layers.Layer):
+    def __init__(self, **kw):
+        super().__init__(**kw)
+        self.seed = keras.random.SeedGenerator(1337)  # Create once here
+    def call(self, inputs):
+        m, s = inputs
+        eps = keras.random.normal(ops.shape(m), seed=self.seed)
+        return m + s * eps
+
+def build_encoder(latent_dim=2):
+    e_in = keras.Input((28,28,1))
+    x = layers.Conv2D(32,3,2,"same",activation="relu")(e_in)
+    x = layers.Conv2D(64,3,2,"same",activation="relu")(x)
+    x = layers.Flatten()(x)
+    x = layers.Dense(16,activation="relu")(x)
+    m = layers.Dense(latent_dim)(x)
+    s = layers.Dense(latent_dim,activation="softplus")(x)
+    z = Sampling()([m,s])
+    return keras.Model(e_in, [m, s, z])
+
+def build_decoder(latent_dim=2):
+    d_in = keras.Input((latent_dim,))
+    x = layers.Dense(7*7*64,activation="relu")(d_in)
+    x = layers.Reshape((7,7,64))(x)
+    x = layers.Conv2DTranspose(64,3,2,"same",activation="relu")(x)
+    x = layers.Conv2DTranspose(32,3,2,"same",activation="relu")(x)
+    d_out = layers.Conv2DTranspose(1,3,1,"same",activation="sigmoid")(x)
+    return keras.Model(d_in, d_out)
+
+class VAE(keras.Model):
+    def __init__(self, enc, dec, **kw):
+        super().__init__(**kw)
+        self.enc, self.dec = enc, dec
+    def train_step(self, data):
+        with tf.GradientTape() as tape:
+            m, s, z = self.enc(data)
+            r = self.dec(z)
+            rl = tf.reduce_mean(tf.reduce_sum(keras.losses.binary_crossentropy(data, r), axis=(1,2)))
+            kl = tf.reduce_mean(tf.reduce_sum(0.5*(s**2+m**2 - 2*tf.math.log(s+1e-8)-1), axis=1))
+            loss = rl + kl
+        grads = tape.gradient(loss, self.trainable_weights)
+        self.optimizer.apply_gradients(zip(grads, self.trainable_weights))
+        return {"loss": loss}
+
+def load_data():
+    (x_train, _), (x_test, _) = keras.datasets.mnist.load_data()
+    return np.expand_dims(np.concatenate([x_train, x_test])/255.0, -1)
+
+def show_variations(encoder, decoder, img, latent_dim=2, n=10):
+    """Encode one image and decode `n` samples around its latent mean."""
+    plt.imshow(img[0].squeeze(), cmap="gray"); plt.axis("off"); plt.show()
+    m, s, _ = encoder.predict(img)
+    noise = np.random.normal(size=(n, latent_dim))
+    z_vars = m + s * noise
+    gen = decoder.predict(z_vars)
+    plt.figure(figsize=(15,2))
+    for i in range(n):
+        plt.subplot(1,n,i+1)
+        plt.imshow(gen[i].squeeze(), cmap="gray")
+        plt.axis("off")
+    plt.show()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="genai_lab vae", description=__doc__)
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--latent-dim", type=int, default=2)
+    parser.add_argument("--index", type=int, default=0, help="image to generate variations of")
+    add_checkpoint_args(parser, every=1, unit="epochs")
+    args = parser.parse_args(argv)
+
+    data = load_data()
+    if not 0 <= args.index < len(data): raise ValueError("Index out of range")
+
+    # Train
+    encoder, decoder = build_encoder(args.latent_dim), build_decoder(args.latent_dim)
+    vae = VAE(encoder, decoder)
+    vae.compile(optimizer="adam")
+    checkpoint = TrainingCheckpoint("vae", args.checkpoint_dir, every_epochs=args.checkpoint_every,
+                                    config=run_config(args, ignore=("index",)), fresh=args.fresh,
+                                    model=vae, optimizer=vae.optimizer)
+    checkpoint.restore(epochs=args.epochs)
+    telemetry = TrainingTelemetry("vae")
+    vae.fit(data, epochs=args.epochs, initial_epoch=checkpoint.epoch, batch_size=128,
+            callbacks=[telemetry.callback(128), checkpoint.callback()])
+    checkpoint.close()
+    telemetry.report()
+    checkpoint.report()
+
+    # Generate Variations
+    show_variations(encoder, decoder, data[args.index:args.index+1], args.latent_dim)
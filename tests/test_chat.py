@@ -0,0 +1,279 @@
+"""ChatClient against a local stub server, plus the cache and batch runner; no network access needed."""
+
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from genai_lab.chat import (ChatClient, ChatError, CompletionCache, ContextWindow, HashingEmbedder, VectorIndex,
+                            chunk_text, make_chat_handler, run_batch_sync)
+
+EVENT_STREAM = {"Content-Type": "text/event-stream"}
+JSON = {"Content-Type": "application/json"}
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Replays `server.script`: one (status, headers, body chunks, close_early) per request."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(self.headers)
+        status, headers, chunks, close_early = self.server.script.pop(0)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunks:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            self.wfile.flush()
+        if close_early:
+            self.close_connection = True
+            return
+        self.wfile.write(b"0\r\n\r\n")
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.script, server.requests = [], []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+
+def client_for(server, **kwargs):
+    return ChatClient("key", base_url=f"http://127.0.0.1:{server.server_port}", **kwargs)
+
+def sse(*deltas, done=True):
+    events = [("data: " + json.dumps({"choices": [{"delta": {"content": d}}]}, ensure_ascii=False) + "\n\n").encode()
+              for d in deltas]
+    return events + ([b"data: [DONE]\n\n"] if done else [])
+
+def test_stream_decodes_utf8_without_charset(stub):
+    stub.script.append((200, EVENT_STREAM, sse("Héllo ", "wörld ", "😀"), False))
+    assert "".join(client_for(stub).stream([{"role": "user", "content": "hi"}])) == "Héllo wörld 😀"
+
+def test_stream_reassembles_multibyte_characters_split_across_chunks(stub):
+    body = b"".join(sse("日本語 😀"))
+    cut = body.index("😀".encode()) + 2  # in the middle of the emoji's four bytes
+    stub.script.append((200, EVENT_STREAM, [b": OPENROUTER PROCESSING\n\n", body[:cut], body[cut:]], False))
+    assert "".join(client_for(stub).stream([{"role": "user", "content": "hi"}])) == "日本語 😀"
+
+def test_stream_cut_off_mid_event_raises(stub):
+    partial = sse("Héllo ")[0] + b'data: {"choices": [{"del'
+    stub.script.append((200, EVENT_STREAM, [partial], False))
+    received = []
+    with pytest.raises(ChatError):
+        for delta in client_for(stub).stream([{"role": "user", "content": "hi"}]):
+            received.append(delta)
+    assert received == ["Héllo "]
+
+def test_stream_connection_dropped_raises(stub):
+    stub.script.append((200, EVENT_STREAM, sse("partial ", done=False), True))
+    with pytest.raises(ChatError):
+        list(client_for(stub).stream([{"role": "user", "content": "hi"}]))
+
+def test_stream_without_done_marker_raises(stub):
+    stub.script.append((200, EVENT_STREAM, sse("no marker", done=False), False))
+    with pytest.raises(ChatError):
+        list(client_for(stub).stream([{"role": "user", "content": "hi"}]))
+
+@pytest.fixture
+def closed_port():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    port = server.server_port
+    server.server_close()
+    return port
+
+def test_stream_unreachable_server_raises_chat_error(closed_port):
+    client = ChatClient("key", base_url=f"http://127.0.0.1:{closed_port}", max_retries=0)
+    with pytest.raises(ChatError, match="could not reach"):
+        list(client.stream([{"role": "user", "content": "hi"}]))
+
+def test_chat_handler_reports_unreachable_server_without_empty_turn(closed_port, tmp_path):
+    client = ChatClient("key", base_url=f"http://127.0.0.1:{closed_port}", max_retries=0)
+    handler = make_chat_handler(client, CompletionCache(str(tmp_path / "cache.sqlite")),
+                                ContextWindow(count_tokens=count_words))
+    history = []
+    list(handler("hi", history))
+    assert history[0] == ("user", "hi")
+    assert len(history) == 2 and "could not reach" in history[1][1]
+
+def completion(content):
+    return [json.dumps({"choices": [{"message": {"content": content}}], "usage": {"total_tokens": 3}}).encode()]
+
+def test_complete_raises_on_error_body(stub):
+    stub.script.append((200, JSON, [b'{"error": {"message": "rate limited"}}'], False))
+    with pytest.raises(ChatError, match="rate limited"):
+        client_for(stub).complete([{"role": "user", "content": "hi"}])
+
+def test_run_batch_records_per_request_errors(stub, tmp_path):
+    requests_path, results_path = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    requests_path.write_text("".join(json.dumps({"request_id": f"r{i}", "prompt": f"q{i}"}) + "\n" for i in range(4)))
+    stub.script += [(200, JSON, completion("a0"), False),
+                    (200, JSON, [b'{"error": {"message": "upstream overloaded"}}'], False),
+                    (200, JSON, [b'{"id": "no choices"}'], False),
+                    (200, JSON, completion("a3"), False)]
+    counts = run_batch_sync(client_for(stub), str(requests_path), str(results_path), concurrency=1, rate=100, burst=4)
+    rows = {r["id"]: r for r in map(json.loads, results_path.read_text().splitlines())}
+    assert counts["ok"] == 2 and counts["error"] == 2
+    assert set(rows) == {"r0", "r1", "r2", "r3"}
+    assert "upstream overloaded" in rows["r1"]["error"] and "error" in rows["r2"]
+
+def test_run_batch_resumes_after_truncated_line_and_reports_malformed_input(stub, tmp_path, capsys):
+    requests_path, results_path = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    requests_path.write_text('{"request_id": "r0", "prompt": "q0"}\n{"request_id": "r1", "pro\n'
+                             '{"request_id": "r2", "prompt": "q2"}\n')
+    results_path.write_text('{"id": "r0", "rep')  # cut off by an interrupted run
+    stub.script += [(200, JSON, completion("a0"), False), (200, JSON, completion("a2"), False)]
+    counts = run_batch_sync(client_for(stub), str(requests_path), str(results_path), concurrency=1, rate=100, burst=2)
+    lines = results_path.read_text().splitlines()
+    assert lines[0] == '{"id": "r0", "rep'
+    assert {json.loads(line)["id"] for line in lines[1:]} == {"r0", "r2"}
+    assert counts["ok"] == 2 and counts["malformed"] == 1
+    assert "1 malformed line(s)" in capsys.readouterr().out
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr("genai_lab.chat.time.sleep", recorded.append)
+    return recorded
+
+def test_post_honours_retry_after_beyond_backoff_max(stub, sleeps):
+    stub.script += [(429, {**JSON, "Retry-After": "45"}, [b"{}"], False), (200, JSON, completion("ok"), False)]
+    reply, response = client_for(stub, backoff_max=30.0).complete([{"role": "user", "content": "hi"}])
+    assert reply == "ok" and response.metrics["attempts"] == 2
+    assert sleeps == [45.0]
+
+def test_post_gives_up_when_retry_after_exceeds_budget(stub, sleeps):
+    stub.script.append((429, {**JSON, "Retry-After": "3600"}, [b"{}"], False))
+    response = client_for(stub, max_retry_after=120.0).post("/chat/completions", {})
+    assert response.status_code == 429 and response.metrics["attempts"] == 1
+    assert sleeps == []
+
+def test_post_falls_back_to_backoff_on_invalid_retry_after(stub, sleeps):
+    stub.script += [(503, {**JSON, "Retry-After": "soon"}, [b"{}"], False), (200, JSON, completion("ok"), False)]
+    reply, _ = client_for(stub, backoff_base=0.5).complete([{"role": "user", "content": "hi"}])
+    assert reply == "ok"
+    assert len(sleeps) == 1 and 0 <= sleeps[0] <= 0.5
+
+def test_post_does_not_resend_after_read_timeout(sleeps):
+    with socket.socket() as listener:  # accepts connections but never answers
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        client = ChatClient("key", base_url=f"http://127.0.0.1:{listener.getsockname()[1]}", read_timeout=0.2,
+                            max_retries=3)
+        with pytest.raises(requests.ReadTimeout):
+            client.post("/chat/completions", {})
+    assert sleeps == [] and client.metrics[-1]["attempts"] == 1
+
+def words(n, word="word"):
+    return " ".join([word] * n)
+
+def count_words(text):
+    return len(text.split())
+
+def test_context_window_keeps_short_conversations_unchanged():
+    context = ContextWindow(max_tokens=1000, count_tokens=count_words)
+    messages = [{"role": "system", "content": "be brief"}] + [{"role": r, "content": words(10)} for r in ["user", "assistant"] * 3]
+    assert context.fit(messages) == messages
+
+def test_context_window_drops_oldest_turns_first():
+    context = ContextWindow(max_tokens=100, keep_recent=2, count_tokens=count_words, summarize=None)
+    messages = [{"role": role, "content": f"turn{i} " + words(19)} for i, role in enumerate(["user", "assistant"] * 4)]
+    fitted = context.fit(messages)
+    assert fitted == messages[-4:] and context.cost(fitted) <= 100
+
+def test_context_window_summarizes_dropped_turns():
+    context = ContextWindow(max_tokens=100, keep_recent=2, count_tokens=count_words,
+                            summarize=lambda dropped: f"{len(dropped)} earlier turns")
+    messages = [{"role": role, "content": words(20)} for role in ["user", "assistant"] * 4]
+    fitted = context.fit(messages)
+    assert fitted[0] == {"role": "system", "content": "Summary of the earlier conversation: 5 earlier turns"}
+    assert fitted[1:] == messages[-3:] and context.cost(fitted) <= 100
+
+def test_context_window_enforces_budget_over_pinned_excerpts():
+    context = ContextWindow(max_tokens=50, count_tokens=count_words)
+    messages = [{"role": "system", "content": words(600, "excerpt")}]
+    messages += [{"role": role, "content": words(20)} for role in ["user", "assistant"] * 3]
+    messages.append({"role": "user", "content": "the question"})
+    fitted = context.fit(messages)
+    assert context.cost(fitted) <= 50
+    assert fitted[-1] == messages[-1] and fitted[0]["role"] == "system"
+
+def test_context_window_truncates_summary_note_to_budget():
+    context = ContextWindow(max_tokens=60, keep_recent=2, count_tokens=count_words,
+                            summarize=lambda dropped: words(100, "summary"))
+    messages = [{"role": role, "content": words(20)} for role in ["user", "assistant"] * 4]
+    fitted = context.fit(messages)
+    assert context.cost(fitted) <= 60
+    assert fitted[0]["content"].startswith("Summary of the earlier conversation") and fitted[-2:] == messages[-2:]
+
+def ask(text):
+    return [{"role": "user", "content": text}]
+
+def test_completion_cache_expires_entries_after_ttl(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("genai_lab.chat.time.time", lambda: now[0])
+    cache = CompletionCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    cache.put("m", ask("hi"), "hello")
+    now[0] += 59
+    assert cache.get("m", ask("hi")) == "hello"
+    now[0] += 2
+    assert cache.get("m", ask("hi")) is None
+    assert CompletionCache(str(tmp_path / "cache.sqlite"), ttl=60).get("m", ask("hi")) is None
+
+def test_completion_cache_evicts_least_recently_used(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    cache = CompletionCache(path, max_memory_entries=2, max_disk_entries=2)
+    cache.put("m", ask("a"), "A")
+    cache.put("m", ask("b"), "B")
+    assert cache.get("m", ask("a")) == "A"  # now "b" is the least recently used
+    cache.put("m", ask("c"), "C")
+    assert cache.stats["memory_hits"] == 1
+    reopened = CompletionCache(path)
+    assert [reopened.get("m", ask(q)) for q in "abc"] == ["A", None, "C"]
+
+def test_completion_cache_normalizes_keys_only_when_asked(tmp_path):
+    exact = CompletionCache(str(tmp_path / "exact.sqlite"))
+    normalized = CompletionCache(str(tmp_path / "normalized.sqlite"), normalize=True)
+    for cache in (exact, normalized):
+        cache.put("m", ask("What is a VAE?"), "an autoencoder")
+    assert exact.get("m", ask("  what is a  vae")) is None
+    assert normalized.get("m", ask("  what is a  vae")) == "an autoencoder"
+    assert normalized.get("other-model", ask("what is a vae")) is None
+
+def test_chunk_text_overlaps_windows_and_skips_blobs():
+    text = " ".join(f"w{i}" for i in range(10)) + " " + "A" * 200
+    chunks = chunk_text(text, chunk_words=4, overlap=1)
+    assert chunks == ["w0 w1 w2 w3", "w3 w4 w5 w6", "w6 w7 w8 w9"]
+    assert chunk_text("   ") == [] and chunk_text("one two", chunk_words=4, overlap=1) == ["one two"]
+
+class CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dim=256)
+        self.calls = 0
+
+    def __call__(self, texts):
+        self.calls += 1
+        return super().__call__(texts)
+
+def test_vector_index_retrieves_and_reuses_the_stored_index(tmp_path):
+    docs = {"gan.md": "The generator and discriminator play a minimax game.",
+            "vae.md": "The encoder outputs a mean and variance for the latent code.",
+            "empty.md": ""}
+    embedder = CountingEmbedder()
+    index = VectorIndex(str(tmp_path / "index"), embedder).build(docs)
+    assert sorted(c["source"] for c in index.chunks) == ["gan.md", "vae.md"]
+    assert index.search("latent variance of the encoder", k=1)[0][1]["source"] == "vae.md"
+    assert "gan.md" in index.context_message("discriminator game", k=1)["content"]
+
+    calls = embedder.calls
+    reloaded = VectorIndex(str(tmp_path / "index"), embedder).build(docs)
+    assert embedder.calls == calls and reloaded.chunks == index.chunks  # loaded from disk, not re-embedded
+    assert VectorIndex(str(tmp_path / "other"), embedder).build({}).context_message("anything") is None